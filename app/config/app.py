@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from enum import StrEnum, auto
 from functools import lru_cache
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Literal
 from urllib.parse import quote_plus
 
 from dotenv import load_dotenv
@@ -70,6 +70,28 @@ class AppConfig(BaseSettings):
         db_uri_alembic = db_uri.replace("%", "%%")
         return db_uri_alembic
 
+    # Connection pool, one per worker process (see core.database.engine)
+    POSTGRES_POOL_SIZE: int = 10
+    POSTGRES_MAX_OVERFLOW: int = 10
+    POSTGRES_POOL_TIMEOUT: float = 30.0
+    POSTGRES_POOL_RECYCLE: int = 1800
+    POSTGRES_POOL_PRE_PING: bool = True
+    # Set both to 0 when running behind pgbouncer in transaction pooling mode
+    POSTGRES_STATEMENT_CACHE_SIZE: int = 100
+    POSTGRES_PREPARED_STATEMENT_CACHE_SIZE: int = 100
+    POSTGRES_ECHO: bool = False
+    # Per-request query counting/timing (see core.database.instrumentation)
+    DB_INSTRUMENTATION_ENABLED: bool = True
+    DB_SLOW_QUERY_MS: float = 200.0
+    DB_REPEATED_QUERY_THRESHOLD: int = 5
+
+    # Background purge of soft-deleted rows (see scripts.purge_soft_deleted)
+    SOFT_DELETE_RETENTION_DAYS: int = 30
+    SOFT_DELETE_PURGE_START_HOUR: int = 2
+    SOFT_DELETE_PURGE_END_HOUR: int = 5
+    SOFT_DELETE_PURGE_CHUNK_SIZE: int = 1000
+    SOFT_DELETE_PURGE_PAUSE_SECONDS: float = 0.5
+
     EMAIL_USER: str
     EMAIL_USER_PASSWORD: str
 
@@ -111,6 +133,22 @@ class AppConfig(BaseSettings):
 
     REDIS_IP: str
     REDIS_PORT: int
+
+    # Read-through entity cache (see core.cache)
+    CACHE_ENABLED: bool = False
+    CACHE_KEY_PREFIX: str = "entity"
+    CACHE_LOCAL_MAXSIZE: int = 10_000
+    CACHE_LOCAL_TTL_SECONDS: float = 5.0
+    CACHE_LOCK_TIMEOUT_MS: int = 2_000
+
+    # Prometheus metrics (see core.metrics). For several workers also export
+    # PROMETHEUS_MULTIPROC_DIR (an empty, writable directory) before starting the server.
+    METRICS_RUNTIME_INTERVAL_SECONDS: float = 5.0
+
+    # `source` (file, line, function) in error responses; unset means all but production
+    ERROR_RESPONSE_INCLUDE_SOURCE: bool | None = None
+    # Default response class: "orjson" (core.responses.ORJSONResponse) or "json" (stdlib)
+    JSON_RESPONSE_CLASS: Literal["orjson", "json"] = "orjson"
     # host_moderator_screen_url: str | None = None
 
     # Slack Intregation
@@ -0,0 +1,225 @@
+from __future__ import annotations
+
+import copy
+import json
+import logging
+import threading
+import time
+from contextvars import ContextVar, Token
+from datetime import datetime, timezone
+from typing import Any
+
+_log_context: ContextVar[dict[str, Any] | None] = ContextVar("log_context", default=None)
+
+# Attributes every LogRecord has; anything else on a record came from `extra=`.
+_RECORD_ATTRIBUTES = frozenset(
+    logging.LogRecord("", logging.INFO, "", 0, "", (), None).__dict__
+) | {"message", "asctime", "log_context", "taskName"}
+
+
+def bind_log_context(**fields: Any) -> Token[dict[str, Any] | None]:  # noqa: ANN401
+    """Start a new context (e.g. per request) whose fields are added to every record."""
+    return _log_context.set(dict(fields))
+
+
+def update_log_context(**fields: Any) -> None:  # noqa: ANN401
+    """Add fields (e.g. the authenticated user) to the current context."""
+    context = _log_context.get()
+    if context is None:
+        _log_context.set(dict(fields))
+    else:
+        context.update(fields)
+
+
+def reset_log_context(token: Token[dict[str, Any] | None]) -> None:
+    _log_context.reset(token)
+
+
+def get_log_context() -> dict[str, Any]:
+    return dict(_log_context.get() or {})
+
+
+class LogContextFilter(logging.Filter):
+    """
+    Copy the bound context onto each record in the logging thread, before records are
+    handed to the queue listener (which runs outside the request's context).
+    """
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        context = _log_context.get()
+        if context:
+            record.log_context = dict(context)
+        return True
+
+
+class JsonFormatter(logging.Formatter):
+    """
+    One JSON object per line: timestamp, level, logger, message, bound context fields,
+    `extra=` fields and, when present, the formatted exception.
+
+    The message is rendered from `msg % args` only here, so with the queue listener
+    the rendering of primitive args happens off the event loop. Caller location is
+    included only with `caller_info`.
+    """
+
+    def __init__(self, *, caller_info: bool = False) -> None:
+        super().__init__()
+        self.caller_info = caller_info
+
+    def format(self, record: logging.LogRecord) -> str:
+        payload: dict[str, Any] = {
+            "timestamp": datetime.fromtimestamp(record.created, timezone.utc).isoformat(
+                timespec="milliseconds"
+            ),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        if self.caller_info:
+            payload["caller"] = f"{record.pathname}:{record.lineno}"
+            payload["function"] = record.funcName
+
+        context = getattr(record, "log_context", None)
+        if context:
+            payload.update(context)
+        payload.update(
+            {key: value for key, value in record.__dict__.items() if key not in _RECORD_ATTRIBUTES}
+        )
+
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            payload["exception"] = record.exc_text
+        if record.stack_info:
+            payload["stack"] = self.formatStack(record.stack_info)
+
+        return json.dumps(payload, default=str, separators=(",", ":"))
+
+
+class LogRateLimitFilter(logging.Filter):
+    """
+    Let through the first `burst` records per call site and exception type in every
+    `period` seconds, then drop the rest. A window with drops is summarized by a copy of
+    its last dropped record with a "suppressed N similar records" note (and a
+    `suppressed` field): attached to the first record after the window, or emitted by
+    `flush` once the window has ended, so quiet call sites are reported too.
+
+    Only records at `min_level` or above are limited. Call sites are keyed by logger,
+    logging call and message template and, for exceptions, where the exception was
+    raised.
+    """
+
+    def __init__(
+        self, *, burst: int, period: float, min_level: int, max_keys: int = 10_000
+    ) -> None:
+        super().__init__()
+        self.burst = burst
+        self.period = period
+        self.min_level = min_level
+        self.max_keys = max_keys
+        # key -> [window start, passed, suppressed, stripped copy of the last suppressed
+        # record]
+        self._windows: dict[tuple[Any, ...], list[Any]] = {}
+        # Reentrant: rendering a dropped record may log through this filter again
+        self._lock = threading.RLock()
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno < self.min_level or hasattr(record, "suppressed"):
+            return True
+
+        key = self._get_key(record)
+        now = time.monotonic()
+        with self._lock:
+            window = self._windows.get(key)
+            if window is None or now - window[0] >= self.period:
+                suppressed = int(window[2]) if window is not None else 0
+                if window is None and len(self._windows) >= self.max_keys:
+                    self._prune(now)
+                self._windows[key] = [now, 1, 0, None]
+            elif window[1] < self.burst:
+                window[1] += 1
+                return True
+            else:
+                window[2] += 1
+                window[3] = self._strip(record)
+                return False
+
+        if suppressed:
+            self._add_suppressed_note(record, suppressed)
+        return True
+
+    def flush(self, *, force: bool = False) -> list[logging.LogRecord]:
+        """
+        Summary records for windows that ended with drops (every window with drops when
+        `force`, e.g. at shutdown). Pass them to `Logger.handle`; they skip this filter.
+        """
+        now = time.monotonic()
+        summaries: list[logging.LogRecord] = []
+        with self._lock:
+            for window in self._windows.values():
+                if not window[2] or (not force and now - window[0] < self.period):
+                    continue
+
+                summary = window[3]
+                self._add_suppressed_note(summary, window[2])
+                summaries.append(summary)
+                window[2], window[3] = 0, None
+        return summaries
+
+    @staticmethod
+    def _strip(record: logging.LogRecord) -> logging.LogRecord:
+        """
+        Copy of `record` with the message rendered and args, exception and stack info
+        dropped, so a held window does not keep tracebacks (and their frames) alive.
+        """
+        stripped = copy.copy(record)
+        try:
+            stripped.msg = record.getMessage()
+        except Exception:  # noqa: BLE001
+            stripped.msg = str(record.msg)
+        stripped.args = ()
+        stripped.exc_info = None
+        stripped.exc_text = None
+        stripped.stack_info = None
+        return stripped
+
+    def _add_suppressed_note(self, record: logging.LogRecord, suppressed: int) -> None:
+        record.msg = (
+            f"{record.getMessage()} "
+            f"[suppressed {suppressed} similar records in the last {self.period:g}s]"
+        )
+        record.args = ()
+        record.suppressed = suppressed
+
+    @staticmethod
+    def _get_key(record: logging.LogRecord) -> tuple[Any, ...]:
+        message = record.msg if isinstance(record.msg, str) else type(record.msg)
+        key: tuple[Any, ...] = (
+            record.name,
+            record.levelno,
+            record.pathname,
+            record.lineno,
+            message,
+        )
+        if record.exc_info and record.exc_info[0] is not None:
+            exc_type, _, traceback = record.exc_info
+            while traceback is not None and traceback.tb_next is not None:
+                traceback = traceback.tb_next
+            origin = (
+                (traceback.tb_frame.f_code.co_filename, traceback.tb_lineno)
+                if traceback is not None
+                else None
+            )
+            key = (*key, exc_type, origin)
+        return key
+
+    def _prune(self, now: float) -> None:
+        expired = [
+            key
+            for key, window in self._windows.items()
+            if now - window[0] >= self.period and not window[2]
+        ]
+        for key in expired:
+            del self._windows[key]
+        if len(self._windows) >= self.max_keys:
+            self._windows.clear()
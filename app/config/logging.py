@@ -1,16 +1,41 @@
 from __future__ import annotations
 
+import atexit
+import contextlib
+import copy
 import logging
 import logging.config
+import logging.handlers
+import os
+import queue
+import threading
 from enum import StrEnum
 from functools import lru_cache
 from pathlib import Path
 from typing import Any, ClassVar
 
-from pydantic import BaseModel
+from config.log_formatters import JsonFormatter, LogContextFilter, LogRateLimitFilter
+from pydantic import BaseModel, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
+class LogQueueOverflowPolicy(StrEnum):
+    DROP_NEW = "drop_new"
+    DROP_OLDEST = "drop_oldest"
+    BLOCK = "block"
+
+    def __str__(self) -> str:
+        return str(self.value)
+
+
+class LogFormatType(StrEnum):
+    TEXT = "text"
+    JSON = "json"
+
+    def __str__(self) -> str:
+        return str(self.value)
+
+
 class LoggerConfig(BaseSettings):
     model_config = SettingsConfigDict(case_sensitive=False, env_file=".env", extra="ignore")
 
@@ -18,10 +43,29 @@ class LoggerConfig(BaseSettings):
     LOG_FORMAT: str = (
         "%(levelprefix)s [%(asctime)s] %(pathname)s:%(lineno)d (%(funcName)s) - %(message)s"
     )
+    # Text format used instead of LOG_FORMAT when LOG_CALLER_INFO is disabled.
+    LOG_FORMAT_NO_CALLER: str = "%(levelprefix)s [%(asctime)s] - %(message)s"
     LOG_LEVEL: str = "DEBUG"
+    LOG_FORMAT_TYPE: LogFormatType = LogFormatType.TEXT
+    # Caller file/line/function in the formatted output of the app's handlers.
+    LOG_CALLER_INFO: bool = True
     LOG_RECORDS_PATH: str = "/opt/logs"
     LOG_FILE_MAX_BYTES: int = 10 * 1024 * 1024  # 10 MB
     LOG_FILE_BACKUP_COUNT: int = 5
+    # Write `<name>.<pid>.log` so several workers never rotate the same file.
+    LOG_FILE_PER_PROCESS: bool = False
+    # Hand records to a background thread so handlers never do I/O on the event loop.
+    LOG_QUEUE_ENABLED: bool = True
+    LOG_QUEUE_MAX_SIZE: int = 10_000
+    # drop_new/drop_oldest drop records and report how many; block waits for room in the
+    # calling thread, which stalls the event loop (every request) while the queue is full.
+    LOG_QUEUE_OVERFLOW_POLICY: LogQueueOverflowPolicy = LogQueueOverflowPolicy.DROP_NEW
+    # Per call site and exception type, pass LOG_RATE_LIMIT_BURST records every
+    # LOG_RATE_LIMIT_PERIOD_SECONDS and summarize the rest (WARNING and above only).
+    LOG_RATE_LIMIT_ENABLED: bool = True
+    LOG_RATE_LIMIT_BURST: int = 10
+    LOG_RATE_LIMIT_PERIOD_SECONDS: float = 60.0
+    LOG_RATE_LIMIT_MIN_LEVEL: str = "WARNING"
     version: Any = 1
     disable_existing_loggers: bool = False
 
@@ -32,6 +76,12 @@ class LoggerConfig(BaseSettings):
             "use_colors": True,
             "datefmt": "%Y-%m-%d %H:%M:%S",
         },
+        "file": {
+            "()": "uvicorn.logging.DefaultFormatter",
+            "format": LOG_FORMAT,
+            "use_colors": False,
+            "datefmt": "%Y-%m-%d %H:%M:%S",
+        },
         "access": {
             "()": "uvicorn.logging.AccessFormatter",
             "format": LOG_FORMAT,
@@ -42,6 +92,15 @@ class LoggerConfig(BaseSettings):
     handlers: dict[str, Any] = {}
     loggers: dict[str, Any] = {}
 
+    @field_validator("LOG_RATE_LIMIT_MIN_LEVEL")
+    @classmethod
+    def validate_log_level(cls, value: str) -> str:
+        value = value.upper()
+        if not isinstance(logging.getLevelName(value), int):
+            msg = f"Unknown log level '{value}'"
+            raise ValueError(msg)  # noqa: TRY004
+        return value
+
 
 class LoggerClass(StrEnum):
     CONSOLE = "logging.StreamHandler"
@@ -98,9 +157,12 @@ class LogHandler:
         handler_config: LogHandlerConfig, config: LoggerConfig
     ) -> dict[str, Any]:
         filename: str = handler_config.filename or handler_config.name
+        if config.LOG_FILE_PER_PROCESS:
+            filename = f"{filename}.{os.getpid()}"
         return {
-            "formatter": "default",
+            "formatter": "file",
             "class": str(LoggerClass.FILE),
+            "level": handler_config.log_level or config.LOG_LEVEL,
             "filename": Path(config.LOG_RECORDS_PATH) / f"{filename}.log",
             "maxBytes": config.LOG_FILE_MAX_BYTES,
             "backupCount": config.LOG_FILE_BACKUP_COUNT,
@@ -118,6 +180,121 @@ class LogHandler:
         }
 
 
+_PRIMITIVE_ARG_TYPES = (str, int, float, bool, type(None))
+
+
+def _has_primitive_args(args: tuple[Any, ...] | dict[str, Any]) -> bool:
+    values = args.values() if isinstance(args, dict) else args
+    return all(type(value) in _PRIMITIVE_ARG_TYPES for value in values)
+
+
+class BoundedQueueHandler(logging.handlers.QueueHandler):
+    """
+    `QueueHandler` over a bounded queue that applies an overflow policy instead of
+    growing without limit. Dropped records are counted and reported by a warning once
+    the queue has room again.
+
+    The `BLOCK` policy waits in the logging thread; logging from async code then blocks
+    the event loop until the listener catches up, so prefer the drop policies there.
+    """
+
+    def __init__(
+        self, log_queue: queue.Queue[logging.LogRecord], policy: LogQueueOverflowPolicy
+    ) -> None:
+        super().__init__(log_queue)
+        self.policy = policy
+        self.dropped = 0
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        if self.policy == LogQueueOverflowPolicy.BLOCK:
+            self.queue.put(record)
+            return
+
+        if self.dropped and not self.queue.full():
+            dropped_record = self._build_dropped_record(record)
+            if self._put(dropped_record):
+                self.dropped = 0
+
+        if self._put(record):
+            return
+
+        self.dropped += 1
+        if self.policy == LogQueueOverflowPolicy.DROP_OLDEST:
+            with contextlib.suppress(queue.Empty):
+                self.queue.get_nowait()
+            self._put(record)
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # Unlike the base class, leave `msg % args` for the listener's formatter when
+        # every arg is an immutable primitive. Other args may change (or stop being
+        # safe to touch) before the listener runs, so those messages and the traceback
+        # are rendered now. The caller's record is left untouched for other handlers.
+        record = copy.copy(record)
+        if record.args and not _has_primitive_args(record.args):
+            record.msg = record.getMessage()
+            record.args = None
+        if record.exc_info:
+            if not record.exc_text:
+                record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+    def _put(self, record: logging.LogRecord) -> bool:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            return False
+        return True
+
+    def _build_dropped_record(self, record: logging.LogRecord) -> logging.LogRecord:
+        return logging.LogRecord(
+            name=record.name,
+            level=logging.WARNING,
+            pathname=__file__,
+            lineno=0,
+            msg="Dropped %s log records because the log queue was full",
+            args=(self.dropped,),
+            exc_info=None,
+        )
+
+
+def start_queue_listener(logger: logging.Logger, config: LoggerConfig) -> None:
+    """Move the logger's handlers behind a bounded queue drained by one thread."""
+    log_queue: queue.Queue[logging.LogRecord] = queue.Queue(maxsize=config.LOG_QUEUE_MAX_SIZE)
+    handlers = list(logger.handlers)
+    listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+    for handler in handlers:
+        logger.removeHandler(handler)
+    logger.addHandler(BoundedQueueHandler(log_queue, config.LOG_QUEUE_OVERFLOW_POLICY))
+    listener.start()
+    atexit.register(listener.stop)
+
+
+def start_rate_limit_flusher(logger: logging.Logger, rate_limit: LogRateLimitFilter) -> None:
+    """
+    Emit "suppressed" summaries of ended rate-limit windows every period from a daemon
+    thread, and all pending ones at exit, so drops are reported even when a call site
+    goes quiet.
+    """
+    stop = threading.Event()
+
+    def flush(*, force: bool = False) -> None:
+        for record in rate_limit.flush(force=force):
+            logger.handle(record)
+
+    def run() -> None:
+        while not stop.wait(rate_limit.period):
+            flush()
+
+    def shutdown() -> None:
+        stop.set()
+        flush(force=True)
+
+    threading.Thread(target=run, name="log-rate-limit-flusher", daemon=True).start()
+    # Registered after the queue listener, so it runs first at exit (atexit is LIFO).
+    atexit.register(shutdown)
+
+
 class LoggingConfigurator:
     def __init__(self, config: LoggerConfig) -> None:
         self.config = config
@@ -132,10 +309,32 @@ class LoggingConfigurator:
         }
         self.config.handlers = handlers
         self.config.loggers = loggers
+        if self.config.LOG_FORMAT_TYPE == LogFormatType.JSON:
+            json_formatter = {"()": JsonFormatter, "caller_info": self.config.LOG_CALLER_INFO}
+            self.config.formatters = {"default": json_formatter, "file": json_formatter}
+        elif not self.config.LOG_CALLER_INFO:
+            formatters = dict(self.config.formatters)
+            for name in ("default", "file"):
+                formatters[name] = {**formatters[name], "format": self.config.LOG_FORMAT_NO_CALLER}
+            self.config.formatters = formatters
 
         dict_config = self.config.dict()
         logging.config.dictConfig(dict_config)
         logger = logging.getLogger(self.config.LOGGER_NAME)
+        logger.addFilter(LogContextFilter())
+        if self.config.LOG_RATE_LIMIT_ENABLED:
+            logger.addFilter(
+                LogRateLimitFilter(
+                    burst=self.config.LOG_RATE_LIMIT_BURST,
+                    period=self.config.LOG_RATE_LIMIT_PERIOD_SECONDS,
+                    min_level=logging.getLevelName(self.config.LOG_RATE_LIMIT_MIN_LEVEL),
+                )
+            )
+        # Raise the logger to the most verbose handler level, so calls below it return
+        # at `isEnabledFor` before a record is even built.
+        handler_levels = [handler.level for handler in logger.handlers]
+        if handler_levels and min(handler_levels) > logger.level:
+            logger.setLevel(min(handler_levels))
         return logger
 
 
@@ -162,6 +361,11 @@ def get_logger() -> logging.Logger:
     configurator = LoggingConfigurator(logger_config)
     handlers: dict[str, dict[str, Any]] = get_handlers(HANDLER_CONFIGURATIONS, logger_config)
     logger = configurator.get_logger(handlers)
+    if logger_config.LOG_QUEUE_ENABLED:
+        start_queue_listener(logger, logger_config)
+    for log_filter in logger.filters:
+        if isinstance(log_filter, LogRateLimitFilter):
+            start_rate_limit_flusher(logger, log_filter)
     return logger
 
 
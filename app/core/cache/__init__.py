@@ -0,0 +1,10 @@
+from core.cache.entity import EntityCache, close_entity_cache, get_entity_cache
+from core.cache.invalidation import has_pending_invalidation, schedule_cache_invalidation
+
+__all__ = [
+    "EntityCache",
+    "close_entity_cache",
+    "get_entity_cache",
+    "has_pending_invalidation",
+    "schedule_cache_invalidation",
+]
@@ -0,0 +1,225 @@
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any
+
+from config import app_config, logger
+from core.cache.local import MISSING, LocalLRUCache
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable, Iterable
+
+Payload = dict[str, Any]
+
+LOCK_POLL_INTERVAL_SECONDS = 0.05
+
+
+class EntityCache:
+    """
+    Two-tier read-through cache for entity payloads (column name -> JSON value).
+
+    Lookups go to the in-process LRU first, then Redis, then the loader. Concurrent
+    misses for the same key inside one process share a single load, and across
+    processes a short Redis lock lets one worker fill the key while others wait for it.
+
+    Keys are tagged per table so that writes can drop every cached query of a table.
+    Entries in the in-process tier of *other* workers are not invalidated and live for
+    at most `CACHE_LOCAL_TTL_SECONDS`.
+    """
+
+    def __init__(
+        self,
+        redis: Redis,
+        *,
+        prefix: str,
+        local_maxsize: int,
+        local_ttl: float,
+        lock_timeout_ms: int,
+    ) -> None:
+        self._redis = redis
+        self._prefix = prefix
+        self._local = LocalLRUCache(maxsize=local_maxsize)
+        self._local_ttl = local_ttl
+        self._lock_timeout_ms = lock_timeout_ms
+        self._inflight: dict[str, asyncio.Future[Payload | None]] = {}
+
+    def id_key(self, table: str, model_id: int) -> str:
+        return f"{self._prefix}:{table}:id:{model_id}"
+
+    def query_key(self, table: str, statement: str) -> str:
+        digest = hashlib.blake2b(statement.encode(), digest_size=16).hexdigest()
+        return f"{self._prefix}:{table}:q:{digest}"
+
+    def _tag(self, table: str, kind: str) -> str:
+        return f"{self._prefix}:{table}:{kind}"
+
+    async def get_or_load(
+        self,
+        key: str,
+        *,
+        table: str,
+        kind: str,
+        ttl: int,
+        load: Callable[[], Awaitable[Payload | None]],
+    ) -> Payload | None:
+        value = self._local.get(key)
+        if value is not MISSING:
+            return value  # type: ignore[no-any-return]
+
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            return await asyncio.shield(inflight)
+
+        future: asyncio.Future[Payload | None] = asyncio.get_running_loop().create_future()
+        future.add_done_callback(_consume_exception)
+        self._inflight[key] = future
+        try:
+            value = await self._load_through(key, table=table, kind=kind, ttl=ttl, load=load)
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as exc:
+            future.set_exception(exc)
+            raise
+        else:
+            future.set_result(value)
+        finally:
+            self._inflight.pop(key, None)
+
+        return value  # type: ignore[no-any-return]
+
+    async def _load_through(
+        self,
+        key: str,
+        *,
+        table: str,
+        kind: str,
+        ttl: int,
+        load: Callable[[], Awaitable[Payload | None]],
+    ) -> Payload | None:
+        tag = self._tag(table, kind)
+        locked = False
+        try:
+            cached = await self._redis.get(key)
+            if cached is None:
+                locked = await self._acquire_fill_lock(key)
+                if not locked:
+                    cached = await self._wait_for_fill(key)
+        except RedisError as exc:
+            logger.warning("Entity cache unavailable, reading %s from database: %s", key, exc)
+            return await load()
+
+        if cached is not None:
+            value: Payload = json.loads(cached)
+            self._local.set(key, value, ttl=min(ttl, self._local_ttl), tag=tag)
+            return value
+
+        try:
+            value = await load()
+        finally:
+            if locked:
+                await self._release_fill_lock(key)
+
+        if value is not None:
+            await self._store(key, value, tag=tag, ttl=ttl)
+        return value
+
+    async def _store(self, key: str, value: Payload, *, tag: str, ttl: int) -> None:
+        try:
+            encoded = json.dumps(value, separators=(",", ":"))
+        except (TypeError, ValueError) as exc:
+            logger.warning("Not caching %s, its payload is not JSON serializable: %s", key, exc)
+            return
+
+        self._local.set(key, value, ttl=min(ttl, self._local_ttl), tag=tag)
+        try:
+            async with self._redis.pipeline(transaction=False) as pipe:
+                pipe.set(key, encoded, ex=ttl)
+                pipe.sadd(tag, key)
+                pipe.expire(tag, ttl)
+                await pipe.execute()
+        except RedisError as exc:
+            logger.warning("Failed to store %s in entity cache: %s", key, exc)
+
+    async def _acquire_fill_lock(self, key: str) -> bool:
+        acquired = await self._redis.set(f"{key}:lock", 1, nx=True, px=self._lock_timeout_ms)
+        return bool(acquired)
+
+    async def _release_fill_lock(self, key: str) -> None:
+        try:
+            await self._redis.delete(f"{key}:lock")
+        except RedisError as exc:
+            logger.warning("Failed to release entity cache lock for %s: %s", key, exc)
+
+    async def _wait_for_fill(self, key: str) -> bytes | None:
+        attempts = max(1, int(self._lock_timeout_ms / 1000 / LOCK_POLL_INTERVAL_SECONDS))
+        for _ in range(attempts):
+            await asyncio.sleep(LOCK_POLL_INTERVAL_SECONDS)
+            cached: bytes | None = await self._redis.get(key)
+            if cached is not None:
+                return cached
+        return None
+
+    def invalidate_local(self, table: str, model_ids: Iterable[int] | None) -> None:
+        self._local.delete_tag(self._tag(table, "queries"))
+        if model_ids is None:
+            self._local.delete_tag(self._tag(table, "ids"))
+            return
+
+        for model_id in model_ids:
+            self._local.delete(self.id_key(table, model_id))
+
+    async def invalidate(self, table: str, model_ids: Iterable[int] | None) -> None:
+        """Drop cached ids (all ids when `model_ids` is None) and every cached query."""
+        self.invalidate_local(table, model_ids)
+
+        query_tag = self._tag(table, "queries")
+        id_tag = self._tag(table, "ids")
+        keys: list[str] = []
+        if model_ids is not None:
+            keys = [self.id_key(table, model_id) for model_id in model_ids]
+
+        try:
+            tags = [query_tag] if model_ids is not None else [query_tag, id_tag]
+            async with self._redis.pipeline(transaction=False) as pipe:
+                for tag in tags:
+                    pipe.smembers(tag)
+                members = await pipe.execute()
+
+            for tag_members in members:
+                keys.extend(member.decode() for member in tag_members)
+            await self._redis.delete(*keys, *tags)
+        except RedisError as exc:
+            logger.warning("Failed to invalidate entity cache for %s: %s", table, exc)
+
+    async def close(self) -> None:
+        self._local.clear()
+        await self._redis.close()
+
+
+def _consume_exception(future: asyncio.Future[Any]) -> None:
+    if not future.cancelled():
+        future.exception()
+
+
+@lru_cache(maxsize=1)
+def get_entity_cache() -> EntityCache:
+    redis = Redis(host=app_config.REDIS_IP, port=app_config.REDIS_PORT)
+    return EntityCache(
+        redis,
+        prefix=app_config.CACHE_KEY_PREFIX,
+        local_maxsize=app_config.CACHE_LOCAL_MAXSIZE,
+        local_ttl=app_config.CACHE_LOCAL_TTL_SECONDS,
+        lock_timeout_ms=app_config.CACHE_LOCK_TIMEOUT_MS,
+    )
+
+
+async def close_entity_cache() -> None:
+    if get_entity_cache.cache_info().currsize:
+        await get_entity_cache().close()
+        get_entity_cache.cache_clear()
@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING
+
+from config import app_config, logger
+from core.cache.entity import get_entity_cache
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from sqlalchemy.ext.asyncio import AsyncSession
+
+PENDING_INVALIDATIONS_KEY = "cache_invalidations"
+
+# table name -> ids to drop, or None to drop every cached id of the table
+PendingInvalidations = dict[str, set[int] | None]
+
+_background_tasks: set[asyncio.Task[None]] = set()
+
+
+def schedule_cache_invalidation(
+    session: AsyncSession, table: str, model_ids: Iterable[int] | None
+) -> None:
+    """Queue cache keys to be dropped once the session's transaction commits."""
+    if not app_config.CACHE_ENABLED:
+        return
+
+    pending: PendingInvalidations = session.info.setdefault(PENDING_INVALIDATIONS_KEY, {})
+    if model_ids is None:
+        pending[table] = None
+        return
+
+    if table in pending and pending[table] is None:
+        return
+
+    pending.setdefault(table, set()).update(model_ids)  # type: ignore[union-attr]
+
+
+def has_pending_invalidation(
+    session: AsyncSession, table: str, model_id: int | None = None
+) -> bool:
+    """
+    Whether this session wrote to `table` (or to `model_id` of it, when given) without
+    committing yet; such reads must skip the cache to see the session's own writes.
+    """
+    pending: PendingInvalidations = session.info.get(PENDING_INVALIDATIONS_KEY, {})
+    if table not in pending:
+        return False
+
+    model_ids = pending[table]
+    return model_ids is None or model_id is None or model_id in model_ids
+
+
+async def _invalidate(pending: PendingInvalidations) -> None:
+    cache = get_entity_cache()
+    for table, model_ids in pending.items():
+        await cache.invalidate(table, model_ids)
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_after_commit(session: Session) -> None:
+    pending: PendingInvalidations | None = session.info.pop(PENDING_INVALIDATIONS_KEY, None)
+    if not pending:
+        return
+
+    cache = get_entity_cache()
+    for table, model_ids in pending.items():
+        cache.invalidate_local(table, model_ids)
+
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        logger.warning("No running event loop, skipped cache invalidation for %s", list(pending))
+        return
+
+    task = loop.create_task(_invalidate(pending))
+    _background_tasks.add(task)
+    task.add_done_callback(_background_tasks.discard)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_after_rollback(session: Session) -> None:
+    session.info.pop(PENDING_INVALIDATIONS_KEY, None)
@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+import time
+from collections import OrderedDict
+from typing import Any
+
+MISSING: Any = object()
+
+
+class LocalLRUCache:
+    """Size-bounded in-process LRU with per-entry expiry and per-tag invalidation."""
+
+    def __init__(self, maxsize: int) -> None:
+        self._maxsize = maxsize
+        self._entries: OrderedDict[str, tuple[float, str, Any]] = OrderedDict()
+        self._tags: dict[str, set[str]] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> Any:  # noqa: ANN401
+        entry = self._entries.get(key)
+        if entry is None:
+            return MISSING
+
+        expires_at, _, value = entry
+        if expires_at <= time.monotonic():
+            self.delete(key)
+            return MISSING
+
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: str, value: Any, *, ttl: float, tag: str) -> None:  # noqa: ANN401
+        if self._maxsize <= 0:
+            return
+
+        self.delete(key)
+        self._entries[key] = (time.monotonic() + ttl, tag, value)
+        self._tags.setdefault(tag, set()).add(key)
+        while len(self._entries) > self._maxsize:
+            oldest_key = next(iter(self._entries))
+            self.delete(oldest_key)
+
+    def delete(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+
+        tag_keys = self._tags.get(entry[1])
+        if tag_keys is not None:
+            tag_keys.discard(key)
+            if not tag_keys:
+                del self._tags[entry[1]]
+
+    def delete_tag(self, tag: str) -> None:
+        for key in list(self._tags.get(tag, ())):
+            self.delete(key)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._tags.clear()
@@ -0,0 +1,25 @@
+from core.database.engine import (
+    dispose_engine,
+    get_engine,
+    get_pool_stats,
+    get_session_factory,
+)
+from core.database.instrumentation import (
+    QueryStats,
+    get_query_stats,
+    reset_query_stats,
+    start_query_stats,
+)
+from core.database.session import get_session
+
+__all__ = [
+    "QueryStats",
+    "dispose_engine",
+    "get_engine",
+    "get_pool_stats",
+    "get_query_stats",
+    "get_session",
+    "get_session_factory",
+    "reset_query_stats",
+    "start_query_stats",
+]
@@ -0,0 +1,147 @@
+from __future__ import annotations
+
+import time
+from contextvars import ContextVar
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any
+
+from config import app_config
+from core.database.instrumentation import instrument_engine
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncEngine
+    from sqlalchemy.pool import ConnectionPoolEntry
+
+# Connect time spent inside the current checkout; a context variable because checkouts
+# from different tasks interleave while they wait on the pool.
+_checkout_connect_seconds: ContextVar[list[float] | None] = ContextVar(
+    "checkout_connect_seconds", default=None
+)
+
+
+@dataclass
+class PoolCheckoutStats:
+    checkouts: int = 0
+    total_wait_seconds: float = 0.0
+    max_wait_seconds: float = 0.0
+    connects: int = 0
+    total_connect_seconds: float = 0.0
+    max_connect_seconds: float = 0.0
+
+    def record(self, wait_seconds: float) -> None:
+        self.checkouts += 1
+        self.total_wait_seconds += wait_seconds
+        self.max_wait_seconds = max(self.max_wait_seconds, wait_seconds)
+
+    def record_connect(self, connect_seconds: float) -> None:
+        self.connects += 1
+        self.total_connect_seconds += connect_seconds
+        self.max_connect_seconds = max(self.max_connect_seconds, connect_seconds)
+
+    @property
+    def avg_wait_seconds(self) -> float:
+        return self.total_wait_seconds / self.checkouts if self.checkouts else 0.0
+
+    @property
+    def avg_connect_seconds(self) -> float:
+        return self.total_connect_seconds / self.connects if self.connects else 0.0
+
+
+class TimedAsyncAdaptedQueuePool(AsyncAdaptedQueuePool):
+    """
+    Queue pool that records how long callers wait to check out a connection.
+
+    The wait covers only queueing for a free slot; opening a new connection (overflow,
+    or replacing one the pool dropped) is recorded separately as connect time.
+    """
+
+    checkout_stats: PoolCheckoutStats
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:  # noqa: ANN401
+        super().__init__(*args, **kwargs)
+        self.checkout_stats = PoolCheckoutStats()
+
+    def recreate(self) -> TimedAsyncAdaptedQueuePool:
+        pool = super().recreate()
+        pool.checkout_stats = self.checkout_stats
+        return pool  # type: ignore[return-value]
+
+    def _do_get(self) -> ConnectionPoolEntry:
+        connect_seconds = [0.0]
+        token = _checkout_connect_seconds.set(connect_seconds)
+        start = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            elapsed = time.perf_counter() - start
+            _checkout_connect_seconds.reset(token)
+            self.checkout_stats.record(max(0.0, elapsed - connect_seconds[0]))
+
+    def _create_connection(self) -> ConnectionPoolEntry:
+        start = time.perf_counter()
+        try:
+            return super()._create_connection()
+        finally:
+            elapsed = time.perf_counter() - start
+            self.checkout_stats.record_connect(elapsed)
+            connect_seconds = _checkout_connect_seconds.get()
+            if connect_seconds is not None:
+                connect_seconds[0] += elapsed
+
+
+@lru_cache(maxsize=1)
+def get_engine() -> AsyncEngine:
+    engine = create_async_engine(
+        app_config.sqlalchemy_database_uri,
+        poolclass=TimedAsyncAdaptedQueuePool,
+        pool_size=app_config.POSTGRES_POOL_SIZE,
+        max_overflow=app_config.POSTGRES_MAX_OVERFLOW,
+        pool_timeout=app_config.POSTGRES_POOL_TIMEOUT,
+        pool_recycle=app_config.POSTGRES_POOL_RECYCLE,
+        pool_pre_ping=app_config.POSTGRES_POOL_PRE_PING,
+        echo=app_config.POSTGRES_ECHO,
+        connect_args={
+            "statement_cache_size": app_config.POSTGRES_STATEMENT_CACHE_SIZE,
+            "prepared_statement_cache_size": app_config.POSTGRES_PREPARED_STATEMENT_CACHE_SIZE,
+        },
+    )
+    if app_config.DB_INSTRUMENTATION_ENABLED:
+        instrument_engine(engine.sync_engine)
+    return engine
+
+
+@lru_cache(maxsize=1)
+def get_session_factory() -> async_sessionmaker[AsyncSession]:
+    return async_sessionmaker(bind=get_engine(), class_=AsyncSession, expire_on_commit=False)
+
+
+async def dispose_engine() -> None:
+    if get_engine.cache_info().currsize:
+        await get_engine().dispose()
+        get_session_factory.cache_clear()
+        get_engine.cache_clear()
+
+
+def get_pool_stats() -> dict[str, Any]:
+    pool = get_engine().pool
+    stats: dict[str, Any] = {"status": pool.status()}
+    if isinstance(pool, TimedAsyncAdaptedQueuePool):
+        checkout_stats = pool.checkout_stats
+        stats.update(
+            {
+                "size": pool.size(),
+                "checked_in": pool.checkedin(),
+                "checked_out": pool.checkedout(),
+                "overflow": pool.overflow(),
+                "checkouts": checkout_stats.checkouts,
+                "checkout_wait_avg_ms": checkout_stats.avg_wait_seconds * 1000,
+                "checkout_wait_max_ms": checkout_stats.max_wait_seconds * 1000,
+                "connects": checkout_stats.connects,
+                "connect_avg_ms": checkout_stats.avg_connect_seconds * 1000,
+                "connect_max_ms": checkout_stats.max_connect_seconds * 1000,
+            }
+        )
+    return stats
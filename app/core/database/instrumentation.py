@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+import time
+from collections import Counter
+from contextvars import ContextVar, Token
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+from config import app_config, logger
+from sqlalchemy import event
+
+if TYPE_CHECKING:
+    from sqlalchemy.engine import Engine, ExecutionContext
+
+_STATEMENT_START_ATTRIBUTE = "_instrumentation_start"
+
+
+@dataclass
+class QueryStats:
+    """Database usage of one unit of work (usually one HTTP request)."""
+
+    count: int = 0
+    total_seconds: float = 0.0
+    slowest_seconds: float = 0.0
+    slowest_statement: str | None = None
+    statements: Counter[str] = field(default_factory=Counter)
+
+    def record(self, statement: str, seconds: float) -> None:
+        self.count += 1
+        self.total_seconds += seconds
+        self.statements[statement] += 1
+        if seconds > self.slowest_seconds:
+            self.slowest_seconds = seconds
+            self.slowest_statement = statement
+
+    def repeated_statements(self, threshold: int) -> dict[str, int]:
+        """Statements executed at least `threshold` times, the usual N+1 signature."""
+        return {
+            statement: count
+            for statement, count in self.statements.most_common()
+            if count >= threshold
+        }
+
+    def as_log_fields(self) -> dict[str, Any]:
+        return {
+            "db_queries": self.count,
+            "db_time_ms": round(self.total_seconds * 1000, 3),
+            "db_slowest_ms": round(self.slowest_seconds * 1000, 3),
+        }
+
+
+_query_stats: ContextVar[QueryStats | None] = ContextVar("query_stats", default=None)
+
+
+def start_query_stats() -> tuple[QueryStats, Token[QueryStats | None]]:
+    stats = QueryStats()
+    return stats, _query_stats.set(stats)
+
+
+def reset_query_stats(token: Token[QueryStats | None]) -> None:
+    _query_stats.reset(token)
+
+
+def get_query_stats() -> QueryStats | None:
+    return _query_stats.get()
+
+
+def redact_parameters(parameters: Any) -> Any:  # noqa: ANN401
+    """Replace bound values with their type names so slow-query logs carry no data."""
+    if isinstance(parameters, dict):
+        return {key: type(value).__name__ for key, value in parameters.items()}
+    if isinstance(parameters, list | tuple):
+        if parameters and isinstance(parameters[0], dict | list | tuple):
+            return [redact_parameters(parameters[0]), f"... {len(parameters)} rows"]
+        return tuple(type(value).__name__ for value in parameters)
+    return type(parameters).__name__
+
+
+# The start time lives on the statement's execution context, so a statement that fails
+# (and never reaches after_cursor_execute) leaves nothing behind on the connection.
+def _before_cursor_execute(context: ExecutionContext | None, **_: Any) -> None:  # noqa: ANN401
+    if context is not None:
+        setattr(context, _STATEMENT_START_ATTRIBUTE, time.perf_counter())
+
+
+def _after_cursor_execute(
+    statement: str,
+    parameters: Any,  # noqa: ANN401
+    context: ExecutionContext | None,
+    executemany: bool,  # noqa: FBT001
+    **_: Any,  # noqa: ANN401
+) -> None:
+    start: float | None = getattr(context, _STATEMENT_START_ATTRIBUTE, None)
+    if start is None:
+        return
+
+    elapsed = time.perf_counter() - start
+    stats = _query_stats.get()
+    if stats is not None:
+        stats.record(statement, elapsed)
+
+    if elapsed * 1000 >= app_config.DB_SLOW_QUERY_MS:
+        logger.warning(
+            "Slow query (%.1f ms): %s | parameters: %s",
+            elapsed * 1000,
+            statement,
+            redact_parameters(parameters),
+            extra={"db_statement_ms": round(elapsed * 1000, 3), "db_executemany": executemany},
+        )
+
+
+def instrument_engine(engine: Engine) -> None:
+    """Time every cursor execution on `engine` (pass `AsyncEngine.sync_engine`)."""
+    if event.contains(engine, "before_cursor_execute", _before_cursor_execute):
+        return
+
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute, named=True)
+    event.listen(engine, "after_cursor_execute", _after_cursor_execute, named=True)
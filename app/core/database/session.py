@@ -0,0 +1,31 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from core.database.engine import get_session_factory
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+
+    from sqlalchemy.ext.asyncio import AsyncSession
+
+
+async def get_session() -> AsyncIterator[AsyncSession]:
+    """
+    Request-scoped session dependency.
+
+    Example:
+        async def endpoint(session: AsyncSession = Depends(get_session)) -> ...:
+            service = UserReadService(session=session, model=User, repository=UserRepository)
+
+    The transaction is committed when the request handler returns and rolled back
+    if it raises.
+    """
+    async with get_session_factory()() as session:
+        try:
+            yield session
+        except Exception:
+            await session.rollback()
+            raise
+        else:
+            await session.commit()
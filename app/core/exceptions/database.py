@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import re
+from dataclasses import dataclass
 from functools import lru_cache
 from typing import TYPE_CHECKING, Any
 
@@ -9,7 +10,9 @@ from core.exceptions.db_constraint_messages import DB_CONSTRAINT_MESSAGES
 from fastapi import status
 
 if TYPE_CHECKING:
-    from sqlalchemy.exc import IntegrityError
+    from collections.abc import Callable
+
+    from sqlalchemy.exc import DBAPIError, IntegrityError
 
 
 class DatabaseException:
@@ -65,6 +68,58 @@ class DatabaseException:
             detail: str = message or "Delete operation failed due to some dependency"
             super().__init__(status=status_code, title=title, detail=detail, context=context)
 
+    class SerializationFailureError(AppExceptionCase):
+        def __init__(
+            self,
+            model: str | None = None,
+            message: str | None = None,
+            exception_message: str | None = None,
+            context: dict[str, Any] | None = None,
+        ) -> None:
+            status_code: int = status.HTTP_409_CONFLICT
+            title: str = f"{model or ''}{self.__class__.__name__}"
+            detail: str = message or exception_message or "Could not serialize the transaction"
+            super().__init__(status=status_code, title=title, detail=detail, context=context)
+
+    class DeadlockDetectedError(AppExceptionCase):
+        def __init__(
+            self,
+            model: str | None = None,
+            message: str | None = None,
+            exception_message: str | None = None,
+            context: dict[str, Any] | None = None,
+        ) -> None:
+            status_code: int = status.HTTP_409_CONFLICT
+            title: str = f"{model or ''}{self.__class__.__name__}"
+            detail: str = message or exception_message or "Deadlock detected"
+            super().__init__(status=status_code, title=title, detail=detail, context=context)
+
+    class QueryCanceledError(AppExceptionCase):
+        def __init__(
+            self,
+            model: str | None = None,
+            message: str | None = None,
+            exception_message: str | None = None,
+            context: dict[str, Any] | None = None,
+        ) -> None:
+            status_code: int = status.HTTP_503_SERVICE_UNAVAILABLE
+            title: str = f"{model or ''}{self.__class__.__name__}"
+            detail: str = message or exception_message or "Query canceled"
+            super().__init__(status=status_code, title=title, detail=detail, context=context)
+
+    class TooManyConnectionsError(AppExceptionCase):
+        def __init__(
+            self,
+            model: str | None = None,
+            message: str | None = None,
+            exception_message: str | None = None,
+            context: dict[str, Any] | None = None,
+        ) -> None:
+            status_code: int = status.HTTP_503_SERVICE_UNAVAILABLE
+            title: str = f"{model or ''}{self.__class__.__name__}"
+            detail: str = message or exception_message or "Too many database connections"
+            super().__init__(status=status_code, title=title, detail=detail, context=context)
+
 
 @lru_cache(maxsize=1)
 def get_db_exceptions() -> DatabaseException:
@@ -74,14 +129,83 @@ def get_db_exceptions() -> DatabaseException:
 db_exceptions: DatabaseException = get_db_exceptions()
 
 
-def get_integrity_error_details(exc: IntegrityError) -> tuple[str | None, str | None]:
-    error_string: str = str(exc.orig)
+# Names asyncpg gives these SQLSTATEs; used for titles when the driver (e.g. psycopg2)
+# does not raise a class per SQLSTATE.
+SQLSTATE_CLASS_NAMES: dict[str, str] = {
+    "23000": "IntegrityConstraintViolationError",
+    "23001": "RestrictViolationError",
+    "23502": "NotNullViolationError",
+    "23503": "ForeignKeyViolationError",
+    "23505": "UniqueViolationError",
+    "23514": "CheckViolationError",
+    "23P01": "ExclusionViolationError",
+    "40001": "SerializationError",
+    "40P01": "DeadlockDetectedError",
+    "53300": "TooManyConnectionsError",
+    "57014": "QueryCanceledError",
+}
+
+# Fallbacks for errors that carry no SQLSTATE attributes
+_CLASS_NAME_PATTERN = re.compile(r"<class '.+?\.(\w+)'>")
+_MESSAGE_PATTERN = re.compile(r">: (.+?)\nDETAIL:")
+_DBAPI_MESSAGE_PATTERN = re.compile(r": (.*?)$")
+_UNIQUE_CONSTRAINT_PATTERN = re.compile(r'unique constraint "(.*?)"')
+_NOT_NULL_COLUMN_PATTERN = re.compile(r"\"([^\"]+)\" of relation")
+_NOT_NULL_RELATION_PATTERN = re.compile(r"of relation \"([^\"]+)\"")
+
+
+@dataclass(frozen=True)
+class DatabaseErrorDetails:
+    sqlstate: str | None = None
+    class_name: str | None = None
+    message: str | None = None
+    constraint_name: str | None = None
+    table_name: str | None = None
+    column_name: str | None = None
+
+
+def get_database_error_details(exc: DBAPIError) -> DatabaseErrorDetails:
+    """
+    Read SQLSTATE, message and constraint/table/column names from the driver exception.
+
+    asyncpg errors are reached through SQLAlchemy's adapter exception (`exc.orig`) and
+    its `__cause__`; psycopg2 errors expose `pgcode` and `diag`. Errors without a
+    SQLSTATE fall back to parsing `str(exc.orig)`.
+    """
+    orig = exc.orig
+    cause = getattr(orig, "__cause__", None)
+    sqlstate: str | None = getattr(cause, "sqlstate", None) or getattr(orig, "sqlstate", None)
+    sqlstate = sqlstate or getattr(orig, "pgcode", None)
+    if sqlstate is None:
+        class_name, message = get_integrity_error_details(exc)
+        return DatabaseErrorDetails(class_name=class_name, message=message)
+
+    if getattr(cause, "sqlstate", None) is not None:
+        return DatabaseErrorDetails(
+            sqlstate=sqlstate,
+            class_name=type(cause).__name__,
+            message=getattr(cause, "message", None) or str(cause),
+            constraint_name=getattr(cause, "constraint_name", None),
+            table_name=getattr(cause, "table_name", None),
+            column_name=getattr(cause, "column_name", None),
+        )
+
+    diag = getattr(orig, "diag", None)
+    return DatabaseErrorDetails(
+        sqlstate=sqlstate,
+        class_name=SQLSTATE_CLASS_NAMES.get(sqlstate),
+        message=getattr(diag, "message_primary", None) or str(orig).split("\n", 1)[0],
+        constraint_name=getattr(diag, "constraint_name", None),
+        table_name=getattr(diag, "table_name", None),
+        column_name=getattr(diag, "column_name", None),
+    )
 
-    class_name_pattern = r"<class '.+?\.(\w+)'>"
-    message_pattern = r">: (.+?)\nDETAIL:"
 
-    class_name_match = re.search(class_name_pattern, error_string)
-    message_match = re.search(message_pattern, error_string)
+def get_integrity_error_details(exc: DBAPIError) -> tuple[str | None, str | None]:
+    error_string: str = str(exc.orig)
+
+    class_name_match = _CLASS_NAME_PATTERN.search(error_string)
+    message_match = _MESSAGE_PATTERN.search(error_string)
 
     class_name: str | None = class_name_match.group(1) if class_name_match else None
     exception_message: str | None = message_match.group(1) if message_match else None
@@ -89,74 +213,107 @@ def get_integrity_error_details(exc: IntegrityError) -> tuple[str | None, str |
     return (class_name, exception_message)
 
 
-def raise_delete_integrity_exception(exc: IntegrityError) -> None:
-    class_name, exception_message = get_integrity_error_details(exc)
-    context = {}
-    if class_name:
-        context["class_name"] = class_name
-    if exception_message:
-        context["exception_message"] = exception_message
+def get_dbapi_error_message(exc: DBAPIError) -> str:
+    details = get_database_error_details(exc)
+    if details.sqlstate is not None and details.message:
+        return details.message
 
-    raise db_exceptions.DeleteFailedException(context=context)
+    error_msg = str(exc.orig)
+    match = _DBAPI_MESSAGE_PATTERN.search(error_msg)  # Everything after the colon (:)
+    return match.group(1) if match else error_msg
 
 
-def is_unique_violation_error(class_name: str) -> bool:
-    return class_name == "UniqueViolationError"
-
+def raise_delete_integrity_exception(exc: IntegrityError) -> None:
+    details = get_database_error_details(exc)
+    context = {}
+    if details.class_name:
+        context["class_name"] = details.class_name
+    if details.message:
+        context["exception_message"] = details.message
+    if details.constraint_name:
+        context["constraint_name"] = details.constraint_name
 
-def is_not_null_violation_error(class_name: str) -> bool:
-    return class_name == "NotNullViolationError"
+    raise db_exceptions.DeleteFailedException(context=context)
 
 
-def get_unique_violation_error(class_name: str, exception_message: str) -> AppExceptionCase:
-    constraint_name_match = re.search(r'unique constraint "(.*?)"', exception_message)
-    constraint_name = constraint_name_match.group(1) if constraint_name_match else None
+def get_unique_violation_error(details: DatabaseErrorDetails) -> AppExceptionCase:
+    exception_message = details.message
     ctx = {
-        "exception_class": class_name,
+        "exception_class": details.class_name,
         "exception_message": exception_message,
     }
+    constraint_name = details.constraint_name
+    if constraint_name is None and exception_message:
+        constraint_name_match = _UNIQUE_CONSTRAINT_PATTERN.search(exception_message)
+        constraint_name = constraint_name_match.group(1) if constraint_name_match else None
     if constraint_name:
-        default_message = "Unique constraint violated: {constraint_name}"
-        exception_message = DB_CONSTRAINT_MESSAGES.get(constraint_name, default_message)
+        exception_message = DB_CONSTRAINT_MESSAGES.get(
+            constraint_name, f"Unique constraint violated: {constraint_name}"
+        )
 
     return db_exceptions.UniqueViolationError(exception_message=exception_message, context=ctx)
 
 
-def get_not_null_violation_error(exception_message: str) -> AppExceptionCase:
-    column_pattern = r"\"([^\"]+)\" of relation"
-    relation_pattern = r"of relation \"([^\"]+)\""
-
-    column_match = re.search(column_pattern, exception_message or "")
-    relation_match = re.search(relation_pattern, exception_message or "")
-
-    column_name = column_match.group(1) if column_match else None
-    relation_name = relation_match.group(1) if relation_match else None
+def get_not_null_violation_error(details: DatabaseErrorDetails) -> AppExceptionCase:
+    exception_message = details.message
+    column_name, relation_name = details.column_name, details.table_name
+    if column_name is None or relation_name is None:
+        column_match = _NOT_NULL_COLUMN_PATTERN.search(exception_message or "")
+        relation_match = _NOT_NULL_RELATION_PATTERN.search(exception_message or "")
+        column_name = column_match.group(1) if column_match else None
+        relation_name = relation_match.group(1) if relation_match else None
     if column_name and relation_name:
         exception_message = f"{relation_name}.{column_name} cannot be null"
 
     return db_exceptions.NotNullViolationError(exception_message=exception_message)
 
 
-def get_custom_integrity_exception(exc: IntegrityError) -> AppExceptionCase:
-    class_name, exception_message = get_integrity_error_details(exc)
+def get_generic_integrity_error(details: DatabaseErrorDetails) -> AppExceptionCase:
+    return db_exceptions.IntegrityException(
+        exception_class=details.class_name,
+        exception_message=details.message,
+    )
 
-    if not class_name or not exception_message:
-        return db_exceptions.IntegrityException(
-            exception_class=class_name,
-            exception_message=exception_message,
-        )
 
-    if is_unique_violation_error(class_name):
-        return get_unique_violation_error(class_name, exception_message)
+INTEGRITY_ERROR_BUILDERS: dict[str, Callable[[DatabaseErrorDetails], AppExceptionCase]] = {
+    "23505": get_unique_violation_error,
+    "23502": get_not_null_violation_error,
+}
+_CLASS_NAME_SQLSTATES = {name: sqlstate for sqlstate, name in SQLSTATE_CLASS_NAMES.items()}
 
-    if is_not_null_violation_error(class_name):
-        return get_not_null_violation_error(exception_message)
 
-    return db_exceptions.IntegrityException(
-        exception_class=class_name,
-        exception_message=exception_message,
-    )
+def get_custom_integrity_exception(exc: IntegrityError) -> AppExceptionCase:
+    details = get_database_error_details(exc)
+    if details.sqlstate is None and (not details.class_name or not details.message):
+        return get_generic_integrity_error(details)
+
+    sqlstate = details.sqlstate or _CLASS_NAME_SQLSTATES.get(details.class_name or "")
+    builder = INTEGRITY_ERROR_BUILDERS.get(sqlstate or "", get_generic_integrity_error)
+    return builder(details)
 
 
 def raise_custom_integrity_exception(exc: IntegrityError) -> None:
     raise get_custom_integrity_exception(exc)
+
+
+# Transient errors the client can retry: conflicts (409) or an overloaded database (503)
+DBAPI_ERROR_EXCEPTIONS: dict[str, type[AppExceptionCase]] = {
+    "40001": DatabaseException.SerializationFailureError,
+    "40P01": DatabaseException.DeadlockDetectedError,
+    "53300": DatabaseException.TooManyConnectionsError,
+    "57014": DatabaseException.QueryCanceledError,
+}
+
+
+def get_custom_dbapi_exception(exc: DBAPIError) -> AppExceptionCase | None:
+    """The app exception for a known transient SQLSTATE, or None for other errors."""
+    details = get_database_error_details(exc)
+    sqlstate = details.sqlstate or _CLASS_NAME_SQLSTATES.get(details.class_name or "")
+    exception_class = DBAPI_ERROR_EXCEPTIONS.get(sqlstate or "")
+    if exception_class is None:
+        return None
+
+    return exception_class(  # type: ignore[call-arg]
+        exception_message=details.message,
+        context={"exception_class": details.class_name, "sqlstate": sqlstate},
+    )
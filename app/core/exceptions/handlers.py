@@ -1,112 +1,167 @@
 from __future__ import annotations
 
-import re
 import sys
-import traceback
 from datetime import datetime, timezone
-from typing import TYPE_CHECKING
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any
 
-from fastapi.encoders import jsonable_encoder
+from config import app_config, logger
 
 if TYPE_CHECKING:
+    from types import TracebackType
+
     from core.exceptions.app import AppExceptionCase
     from sqlalchemy.exc import DBAPIError, IntegrityError
     from starlette.exceptions import HTTPException
     from starlette.requests import Request
 
-from core.exceptions.database import get_custom_integrity_exception
-from core.exceptions.response_schemas import (
-    AppExceptionResponse,
-    ExceptionResponse,
-    ExceptionSource,
+from core.exceptions.database import (
+    get_custom_dbapi_exception,
+    get_custom_integrity_exception,
+    get_dbapi_error_message,
 )
+from core.metrics import EXCEPTIONS
+from core.responses import ORJSONResponse, dumps_lenient
 from fastapi import status
-from starlette.responses import JSONResponse
 
 
-def _build_error_dict(exception_response: ExceptionResponse) -> AppExceptionResponse:
-    errors = [exception_response]
-    meta = {
-        "timestamp": str(datetime.now(timezone.utc)),
-    }
-    response = AppExceptionResponse(errors=errors, meta=meta)
-    return response
+def _get_timestamp() -> str:
+    return str(datetime.now(timezone.utc))
 
 
-def _build_json_response(exception_response: ExceptionResponse) -> JSONResponse:
-    content = _build_error_dict(exception_response)
-    return JSONResponse(
-        status_code=exception_response.status,
-        content=jsonable_encoder(content),
-    )
+def _dump_error(
+    status_code: int,
+    title: str,
+    detail: Any,  # noqa: ANN401
+    source: dict[str, Any] | None,
+    context: dict[str, Any] | None,
+) -> bytes:
+    error = {
+        "status": status_code,
+        "title": title,
+        "detail": detail,
+        "source": source,
+        "context": context,
+    }
+    return dumps_lenient(error)
+
+
+@lru_cache(maxsize=1024)
+def _dump_static_error(status_code: int, title: str, detail: str | None) -> bytes:
+    return _dump_error(status_code, title, detail, None, None)
+
+
+def _build_json_response(
+    status_code: int,
+    title: str,
+    detail: Any,  # noqa: ANN401
+    source: dict[str, Any] | None = None,
+    context: dict[str, Any] | None = None,
+) -> ORJSONResponse:
+    EXCEPTIONS.labels(title).inc()
+    if source is None and context is None and (detail is None or isinstance(detail, str)):
+        # Without source or context the error object only depends on hashable fields.
+        error = _dump_static_error(status_code, title, detail)
+    else:
+        error = _dump_error(status_code, title, detail, source, context)
+
+    body = b'{"errors":[%s],"meta":{"timestamp":"%s"}}' % (error, _get_timestamp().encode())
+    return ORJSONResponse(content=body, status_code=status_code)
+
+
+def _include_source() -> bool:
+    if app_config.ERROR_RESPONSE_INCLUDE_SOURCE is not None:
+        return app_config.ERROR_RESPONSE_INCLUDE_SOURCE
+    return not app_config.is_production_environment
+
+
+def _get_caller(request: Request, exc: BaseException) -> dict[str, Any] | None:
+    """
+    Where `exc` was raised, read from the innermost traceback frame only (no source
+    lines are loaded). Returns None when sources are hidden, by default in production.
+    """
+    if not _include_source():
+        return None
+
+    exc_traceback: TracebackType | None = exc.__traceback__ or sys.exc_info()[2]
+    filename, line_number, function = "", 0, None
+    if exc_traceback is not None:
+        while exc_traceback.tb_next is not None:
+            exc_traceback = exc_traceback.tb_next
+        code = exc_traceback.tb_frame.f_code
+        filename, line_number, function = code.co_filename, exc_traceback.tb_lineno, code.co_name
+
+    return {
+        "file": filename,
+        "line_number": line_number,
+        "function_name": function,
+        "api_path": request.url.path,
+        "api_method": request.method,
+    }
 
 
-def _get_caller(request: Request) -> ExceptionSource:
-    _, _, exc_traceback = sys.exc_info()
-    filename, line_number, function, _ = traceback.extract_tb(exc_traceback)[-1]
-    api_path = request.url.path
-    api_method = request.method
-    caller_info = ExceptionSource(
-        file=filename,
-        line_number=line_number,
-        function_name=function,
-        api_path=api_path,
-        api_method=api_method,
+# exception handler ======================
+async def app_exception_handler(request: Request, exc: AppExceptionCase) -> ORJSONResponse:
+    return _build_json_response(
+        exc.status, exc.title, exc.detail, _get_caller(request, exc), exc.context
     )
-    return caller_info
 
 
-# exception handler ======================
-async def app_exception_handler(request: Request, exc: AppExceptionCase) -> JSONResponse:
-    exception_source: ExceptionSource = _get_caller(request)
-    content: ExceptionResponse = exc.__response__(source=exception_source)
-    return _build_json_response(content)
-
-
-async def http_exception_handler(request: Request, exc: HTTPException) -> JSONResponse:
-    exception_response = ExceptionResponse(
-        status=exc.status_code,
-        title=exc.__class__.__name__,
-        detail=exc.detail,
-        source=_get_caller(request),
+async def http_exception_handler(request: Request, exc: HTTPException) -> ORJSONResponse:
+    return _build_json_response(
+        exc.status_code, exc.__class__.__name__, exc.detail, _get_caller(request, exc)
     )
-    return _build_json_response(exception_response)
 
 
-async def integrity_error_handler(request: Request, exc: IntegrityError) -> JSONResponse:
+async def integrity_error_handler(request: Request, exc: IntegrityError) -> ORJSONResponse:
     app_exception = get_custom_integrity_exception(exc)
-    exception_source: ExceptionSource = _get_caller(request)
-    content: ExceptionResponse = app_exception.__response__(source=exception_source)
-    return _build_json_response(content)
-
-
-async def dbapi_error_handler(request: Request, exc: DBAPIError) -> JSONResponse:
-    error_msg = str(exc.orig)
-    match = re.search(r": (.*?)$", error_msg)  # Capture everything after the colon (:)
-    if match:
-        error_msg = match.group(1)
-
-    exception_response: ExceptionResponse = ExceptionResponse(
-        status=status.HTTP_500_INTERNAL_SERVER_ERROR,
-        title=exc.__class__.__name__,
-        detail=error_msg,
-        source=_get_caller(request),
+    return _build_json_response(
+        app_exception.status,
+        app_exception.title,
+        app_exception.detail,
+        _get_caller(request, exc),
+        app_exception.context,
     )
 
-    return _build_json_response(exception_response)
+
+async def dbapi_error_handler(request: Request, exc: DBAPIError) -> ORJSONResponse:
+    app_exception = get_custom_dbapi_exception(exc)
+    if app_exception is not None:
+        logger.warning("Database error on %s %s: %s", request.method, request.url.path, exc.orig)
+        return _build_json_response(
+            app_exception.status,
+            app_exception.title,
+            app_exception.detail,
+            _get_caller(request, exc),
+            app_exception.context,
+        )
+
+    logger.error(
+        "Database error on %s %s: %s", request.method, request.url.path, exc.orig, exc_info=exc
+    )
+    return _build_json_response(
+        status.HTTP_500_INTERNAL_SERVER_ERROR,
+        exc.__class__.__name__,
+        get_dbapi_error_message(exc),
+        _get_caller(request, exc),
+    )
 
 
-async def unhandled_exception_handler(request: Request, exc: Exception) -> JSONResponse:
-    _, detail, _ = sys.exc_info()
+async def unhandled_exception_handler(request: Request, exc: Exception) -> ORJSONResponse:
+    logger.error(
+        "Unhandled %s on %s %s",
+        exc.__class__.__name__,
+        request.method,
+        request.url.path,
+        exc_info=exc,
+    )
     status_code = status.HTTP_500_INTERNAL_SERVER_ERROR
     if hasattr(exc, "status_code"):
         status_code = exc.status_code
 
-    exception_response = ExceptionResponse(
-        status=status_code,
-        title=exc.__class__.__name__,
-        detail=str(detail) or "Internal Server Error",
-        source=_get_caller(request),
+    return _build_json_response(
+        status_code,
+        exc.__class__.__name__,
+        str(exc) or "Internal Server Error",
+        _get_caller(request, exc),
     )
-
-    return _build_json_response(exception_response)
@@ -0,0 +1,22 @@
+from core.metrics.exposition import mark_process_dead, render_metrics
+from core.metrics.http import (
+    EXCEPTIONS,
+    REQUEST_LATENCY,
+    REQUESTS_IN_PROGRESS,
+    RESPONSES,
+    UNMATCHED_ROUTE,
+    get_route_label,
+)
+from core.metrics.runtime import run_runtime_metrics
+
+__all__ = [
+    "EXCEPTIONS",
+    "REQUESTS_IN_PROGRESS",
+    "REQUEST_LATENCY",
+    "RESPONSES",
+    "UNMATCHED_ROUTE",
+    "get_route_label",
+    "mark_process_dead",
+    "render_metrics",
+    "run_runtime_metrics",
+]
@@ -0,0 +1,35 @@
+from __future__ import annotations
+
+import os
+
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    CollectorRegistry,
+    generate_latest,
+    multiprocess,
+)
+
+# Set before the app is imported (and wiped between deployments) to aggregate metrics
+# of all worker processes through shared mmap files in this directory.
+MULTIPROCESS_DIR_ENV = "PROMETHEUS_MULTIPROC_DIR"
+
+
+def is_multiprocess_mode() -> bool:
+    return bool(os.environ.get(MULTIPROCESS_DIR_ENV))
+
+
+def render_metrics() -> tuple[bytes, str]:
+    """Prometheus text exposition of this process, or of every worker in multiprocess mode."""
+    if not is_multiprocess_mode():
+        return generate_latest(REGISTRY), CONTENT_TYPE_LATEST
+
+    registry = CollectorRegistry()
+    multiprocess.MultiProcessCollector(registry)
+    return generate_latest(registry), CONTENT_TYPE_LATEST
+
+
+def mark_process_dead() -> None:
+    """Drop this worker's live gauges from the shared files; call on shutdown."""
+    if is_multiprocess_mode():
+        multiprocess.mark_process_dead(os.getpid())
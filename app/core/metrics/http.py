@@ -0,0 +1,39 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from prometheus_client import Counter, Gauge, Histogram
+
+if TYPE_CHECKING:
+    from starlette.types import Scope
+
+# Label for requests that matched no route, so unknown paths cannot blow up cardinality.
+UNMATCHED_ROUTE = "<unmatched>"
+
+REQUEST_LATENCY = Histogram(
+    "http_request_duration_seconds",
+    "Time from receiving an HTTP request to sending the last response byte.",
+    ["method", "route"],
+    buckets=(0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0),
+)
+REQUESTS_IN_PROGRESS = Gauge(
+    "http_requests_in_progress",
+    "HTTP requests currently being handled.",
+    multiprocess_mode="livesum",
+)
+RESPONSES = Counter(
+    "http_responses",
+    "HTTP responses sent, by status code.",
+    ["method", "route", "status"],
+)
+EXCEPTIONS = Counter(
+    "app_exceptions",
+    "Exceptions turned into error responses, by exception title.",
+    ["title"],
+)
+
+
+def get_route_label(scope: Scope) -> str:
+    """Route template (`/items/{item_id}`) the router matched for this request."""
+    route = scope.get("route")
+    return getattr(route, "path_format", None) or UNMATCHED_ROUTE
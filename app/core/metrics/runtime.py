@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+import asyncio
+import time
+
+from config import logger
+from core.database import get_pool_stats
+from prometheus_client import Gauge
+
+DB_POOL_SIZE = Gauge(
+    "db_pool_size", "Configured connection pool size.", multiprocess_mode="livesum"
+)
+DB_POOL_CHECKED_OUT = Gauge(
+    "db_pool_checked_out", "Connections currently checked out.", multiprocess_mode="livesum"
+)
+DB_POOL_CHECKED_IN = Gauge(
+    "db_pool_checked_in", "Idle connections held by the pool.", multiprocess_mode="livesum"
+)
+DB_POOL_OVERFLOW = Gauge(
+    "db_pool_overflow", "Connections opened beyond pool_size.", multiprocess_mode="livesum"
+)
+DB_POOL_CHECKOUT_WAIT_MAX = Gauge(
+    "db_pool_checkout_wait_max_seconds",
+    "Longest wait for a free pool slot since start, excluding connect time.",
+    multiprocess_mode="livemax",
+)
+DB_POOL_CONNECT_MAX = Gauge(
+    "db_pool_connect_max_seconds",
+    "Longest time spent opening a new pool connection since start.",
+    multiprocess_mode="livemax",
+)
+EVENT_LOOP_LAG = Gauge(
+    "event_loop_lag_seconds",
+    "How late the last periodic event-loop wake-up fired.",
+    multiprocess_mode="livemax",
+)
+
+
+def update_pool_metrics() -> None:
+    stats = get_pool_stats()
+    if "size" not in stats:
+        return
+
+    DB_POOL_SIZE.set(stats["size"])
+    DB_POOL_CHECKED_OUT.set(stats["checked_out"])
+    DB_POOL_CHECKED_IN.set(stats["checked_in"])
+    DB_POOL_OVERFLOW.set(stats["overflow"])
+    DB_POOL_CHECKOUT_WAIT_MAX.set(stats["checkout_wait_max_ms"] / 1000)
+    DB_POOL_CONNECT_MAX.set(stats["connect_max_ms"] / 1000)
+
+
+async def run_runtime_metrics(interval_seconds: float) -> None:
+    """Sample event-loop lag and pool stats every `interval_seconds` until cancelled."""
+    while True:
+        start = time.perf_counter()
+        await asyncio.sleep(interval_seconds)
+        EVENT_LOOP_LAG.set(max(0.0, time.perf_counter() - start - interval_seconds))
+        try:
+            update_pool_metrics()
+        except Exception:  # noqa: BLE001
+            logger.exception("Failed to collect database pool metrics")
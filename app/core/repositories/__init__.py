@@ -1,11 +1,22 @@
-from core.repositories.base import BaseDBModel, BaseModelProtocol, BaseRepository
-from core.repositories.base_bulk_upsert import BaseBulkUpsertRepository, BulkUpsertConflict
+from core.repositories.base import (
+    BaseDBModel,
+    BaseModelProtocol,
+    BaseRepository,
+    SoftDeleteMixin,
+)
+from core.repositories.base_bulk_upsert import (
+    BaseBulkUpsertRepository,
+    BulkUpsertConflict,
+    BulkUpsertStats,
+)
 from core.repositories.base_create import BaseCreateRepository
-from core.repositories.base_delete import BaseDeleteRepository
+from core.repositories.base_delete import DEFAULT_DELETE_CHUNK_SIZE, BaseDeleteRepository
 from core.repositories.base_read import BaseReadRepository
-from core.repositories.base_update import BaseUpdateRepository
+from core.repositories.base_update import BaseUpdateRepository, UpdateManyResult
+from core.repositories.pagination import KeysetPage
 
 __all__ = [
+    "DEFAULT_DELETE_CHUNK_SIZE",
     "BaseBulkUpsertRepository",
     "BaseCreateRepository",
     "BaseDBModel",
@@ -15,4 +26,8 @@ __all__ = [
     "BaseRepository",
     "BaseUpdateRepository",
     "BulkUpsertConflict",
+    "BulkUpsertStats",
+    "KeysetPage",
+    "SoftDeleteMixin",
+    "UpdateManyResult",
 ]
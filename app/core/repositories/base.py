@@ -1,14 +1,23 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Protocol
+from typing import TYPE_CHECKING, Any, ClassVar, Protocol
 
+from config import app_config
+from core.cache import schedule_cache_invalidation
+from sqlalchemy import literal
+from sqlalchemy.dialects.postgresql import ARRAY
 from sqlalchemy.orm import DeclarativeBase
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
     from datetime import datetime
 
     from sqlalchemy.ext.asyncio import AsyncSession
     from sqlalchemy.orm import Mapped
+    from sqlalchemy.sql.expression import BinaryExpression, BindParameter
+
+# PostgreSQL wire protocol limit on bind parameters in a single statement
+MAX_BIND_PARAMETERS = 32_767
 
 
 class Base(DeclarativeBase):  # type: ignore
@@ -37,7 +46,23 @@ class BaseDBModel(Base):
     deleted_by_id: Mapped[int]
 
 
+class SoftDeleteMixin:
+    """
+    Marks a model as soft-deleted: its repositories stamp `deleted_at` instead of
+    deleting rows, and `scripts.purge_soft_deleted` purges it.
+    """
+
+
 class BaseRepository:
+    # Seconds to keep entities of this repository's model in the read-through cache.
+    # `None` (or a non-positive value) disables caching for the model; `CACHE_ENABLED`
+    # must also be set.
+    cache_ttl: ClassVar[int | None] = None
+    # Stamp `deleted_at` instead of deleting rows, and hide stamped rows from reads.
+    # Pair it with partial indexes `WHERE deleted_at IS NULL` on the model's hot columns.
+    # `None` follows the model: enabled for models using `SoftDeleteMixin`.
+    soft_delete: ClassVar[bool | None] = None
+
     def __init__(self, session: AsyncSession, model: type[BaseDBModel]) -> None:
         self._session: AsyncSession = session
         self._model: type[BaseDBModel] = model
@@ -52,3 +77,36 @@ class BaseRepository:
     @property
     def session(self) -> AsyncSession:
         return self._session
+
+    def _forget_loaded(self, model_ids: Iterable[int] | None = None) -> None:
+        loaders: dict[type, Any] = self._session.info.get("batch_loaders", {})
+        loader = loaders.get(self._model)
+        if loader is not None:
+            loader.clear(model_ids)
+
+    @property
+    def is_cached(self) -> bool:
+        return app_config.CACHE_ENABLED and self.cache_ttl is not None and self.cache_ttl > 0
+
+    @property
+    def is_soft_delete(self) -> bool:
+        if self.soft_delete is not None:
+            return self.soft_delete
+
+        return issubclass(self._model, SoftDeleteMixin)
+
+    def _invalidate_cache(self, model_ids: Iterable[int] | None = None) -> None:
+        # The batch loader memo is dropped right away; the entity cache after commit.
+        model_ids = list(model_ids) if model_ids is not None else None
+        self._forget_loaded(model_ids)
+        schedule_cache_invalidation(self._session, self._model.__table__.name, model_ids)
+
+    def _id_array(self, model_ids: list[Any]) -> BindParameter[Any]:
+        # One array parameter typed like the primary key, so bigint and UUID ids work too
+        return literal(model_ids, type_=ARRAY(self._model.__table__.columns["id"].type))
+
+    def _soft_delete_filters(self) -> tuple[BinaryExpression, ...]:
+        if not self.is_soft_delete:
+            return ()
+
+        return (self._model.deleted_at.is_(None),)
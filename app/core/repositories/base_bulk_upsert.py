@@ -1,16 +1,25 @@
 from __future__ import annotations
 
+import threading
+import time
 from abc import ABC
+from collections import OrderedDict
 from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any
+from uuid import uuid4
 
+from config import logger
 from core.exceptions import raise_custom_integrity_exception
-from core.repositories.base import BaseRepository
+from core.repositories.base import MAX_BIND_PARAMETERS, BaseRepository
+from sqlalchemy import Boolean, Column, and_, column, literal_column, or_, select, table, text
 from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import InstrumentedAttribute
 
 if TYPE_CHECKING:
-    from sqlalchemy.sql import Insert
+    from sqlalchemy.engine import Result
+    from sqlalchemy.ext.asyncio import AsyncConnection
+    from sqlalchemy.sql import Insert, Select
     from sqlalchemy.sql.elements import BinaryExpression
 
 
@@ -21,10 +30,37 @@ class BulkUpsertConflict:
     do_nothing: bool = False
 
 
+@dataclass
+class BulkUpsertStats:
+    rows: int = 0
+    chunks: int = 0
+    seconds: float = 0.0
+    # Only tracked with `skip_unchanged`; rows filtered out by `update_where` count as unchanged
+    inserted: int | None = None
+    updated: int | None = None
+    unchanged: int | None = None
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.rows / self.seconds if self.seconds else 0.0
+
+
 DEFAULT_CONFLICT = BulkUpsertConflict()
 
+UPSERT_STATEMENT_CACHE_SIZE = 512
+
+# Extra RETURNING column used to tell inserted rows from updated ones
+INSERTED_FLAG = "_upsert_inserted"
+
+# (repository class, model, conflict, update columns, returning columns) -> statement
+_upsert_statement_cache: OrderedDict[tuple[Any, ...], Insert] = OrderedDict()
+# Guards the cache's LRU bookkeeping for sync (`run_sync`) and threaded callers
+_upsert_statement_cache_lock = threading.Lock()
+
 
 class BaseBulkUpsertRepository(BaseRepository, ABC):
+    last_bulk_upsert_stats: BulkUpsertStats | None = None
+
     # Determine the conflict columns; use primary key if not provided
     def get_conflict_columns(self, conflict: BulkUpsertConflict) -> list[str]:
         if conflict.columns:
@@ -39,7 +75,148 @@ class BaseBulkUpsertRepository(BaseRepository, ABC):
 
         return {col.name: stmt.excluded[col.name] for col in self._model.__table__.columns}
 
-    async def bulk_upsert(
+    # Ids touched by `data`, or None when rows are matched on other columns
+    def get_affected_ids(self, data: list[dict[str, Any]]) -> list[int] | None:
+        if any("id" not in row for row in data):
+            return None
+
+        return [row["id"] for row in data]
+
+    # Largest number of rows whose bind parameters fit into one statement
+    def get_chunk_size(self, data: list[dict[str, Any]]) -> int:
+        column_count = max(len(data[0]), 1) if data else 1
+        return max(MAX_BIND_PARAMETERS // column_count, 1)
+
+    def get_upsert_statement(
+        self,
+        *,
+        update_columns: list[str] | None = None,
+        update_where: BinaryExpression | None = None,
+        conflict: BulkUpsertConflict = DEFAULT_CONFLICT,
+        returning_columns: list[Any] | None = None,
+        skip_unchanged: bool = False,
+    ) -> Insert:
+        """
+        Return a parameterized upsert statement, reusing a cached one when possible.
+
+        The statement carries no row values, so the same object (and with it SQLAlchemy's
+        compiled form and asyncpg's prepared statement) is reused by every executemany
+        call with the same shape. Statements with `conflict.where` or `update_where`
+        are built per call because their bound values are not part of the cache key.
+        """
+        cache_key = self.get_upsert_statement_cache_key(
+            update_columns=update_columns,
+            update_where=update_where,
+            conflict=conflict,
+            returning_columns=returning_columns,
+            skip_unchanged=skip_unchanged,
+        )
+        if cache_key is not None:
+            with _upsert_statement_cache_lock:
+                if (stmt := _upsert_statement_cache.get(cache_key)) is not None:
+                    _upsert_statement_cache.move_to_end(cache_key)
+                    return stmt
+
+        stmt = self.build_upsert_statement(
+            update_columns=update_columns,
+            update_where=update_where,
+            conflict=conflict,
+            returning_columns=returning_columns,
+            skip_unchanged=skip_unchanged,
+        )
+        if cache_key is not None:
+            with _upsert_statement_cache_lock:
+                # A concurrent caller may have built it first; keep one object per key
+                stmt = _upsert_statement_cache.setdefault(cache_key, stmt)
+                _upsert_statement_cache.move_to_end(cache_key)
+                if len(_upsert_statement_cache) > UPSERT_STATEMENT_CACHE_SIZE:
+                    _upsert_statement_cache.popitem(last=False)
+
+        return stmt
+
+    def get_upsert_statement_cache_key(
+        self,
+        *,
+        update_columns: list[str] | None,
+        update_where: BinaryExpression | None,
+        conflict: BulkUpsertConflict,
+        returning_columns: list[Any] | None,
+        skip_unchanged: bool,
+    ) -> tuple[Any, ...] | None:
+        if conflict.where is not None or update_where is not None:
+            return None
+
+        returning_key: tuple[str, ...] = ()
+        if returning_columns:
+            cacheable_types = (Column, InstrumentedAttribute)
+            if not all(isinstance(col, cacheable_types) for col in returning_columns):
+                return None
+            returning_key = tuple(str(col) for col in returning_columns)
+
+        return (
+            type(self),
+            self._model,
+            tuple(conflict.columns) if conflict.columns else None,
+            conflict.do_nothing,
+            tuple(update_columns) if update_columns else None,
+            returning_key,
+            skip_unchanged,
+        )
+
+    def build_upsert_statement(  # noqa: PLR0913
+        self,
+        *,
+        update_columns: list[str] | None = None,
+        update_where: BinaryExpression | None = None,
+        conflict: BulkUpsertConflict = DEFAULT_CONFLICT,
+        returning_columns: list[Any] | None = None,
+        skip_unchanged: bool = False,
+        source: Select[Any] | None = None,
+    ) -> Insert:
+        stmt = insert(self._model.__table__)
+        if source is not None:
+            stmt = stmt.from_select(list(source.selected_columns.keys()), source)
+
+        conflict_columns = self.get_conflict_columns(conflict)
+
+        if conflict.do_nothing:
+            stmt = stmt.on_conflict_do_nothing(
+                index_elements=conflict_columns,
+                index_where=conflict.where,
+            )
+        else:
+            set_columns = self.get_update_columns(stmt, update_columns)
+            if skip_unchanged:
+                update_where = self.get_changed_where(set_columns, update_where)
+            stmt = stmt.on_conflict_do_update(
+                index_elements=conflict_columns,
+                index_where=conflict.where,
+                set_=set_columns,
+                where=update_where,
+            )
+
+        if skip_unchanged:
+            inserted = literal_column("(xmax = 0)", Boolean).label(INSERTED_FLAG)
+            stmt = stmt.returning(*(returning_columns or []), inserted)
+        elif returning_columns:
+            stmt = stmt.returning(*returning_columns)
+
+        return stmt
+
+    # Only update rows where at least one of the set columns would change
+    def get_changed_where(
+        self, set_columns: dict[str, Any], update_where: BinaryExpression | None
+    ) -> BinaryExpression:
+        table_columns = self._model.__table__.columns
+        changed = or_(
+            *(table_columns[name].is_distinct_from(value) for name, value in set_columns.items())
+        )
+        if update_where is None:
+            return changed
+
+        return and_(update_where, changed)
+
+    async def bulk_upsert(  # noqa: PLR0913
         self,
         data: list[dict[str, Any]],
         *,
@@ -47,6 +224,9 @@ class BaseBulkUpsertRepository(BaseRepository, ABC):
         update_where: BinaryExpression | None = None,
         conflict: BulkUpsertConflict = DEFAULT_CONFLICT,
         returning_columns: list[Any] | None = None,
+        chunk_size: int | None = None,
+        use_copy: bool = False,
+        skip_unchanged: bool = False,
     ) -> list[dict[str, Any]]:
         """
         Example:
@@ -83,33 +263,207 @@ class BaseBulkUpsertRepository(BaseRepository, ABC):
                 if a conflict is detected.
             - `returning_columns` allows you to specify which columns to return
                 after the upsert operation.
+            - `data` is executed as executemany batches of `chunk_size` rows. Every row
+                must have the same keys. Without RETURNING each row is bound separately, so
+                by default all rows go in one batch. With RETURNING (or `skip_unchanged`)
+                rows are rendered into multi-row VALUES statements, so the default chunk
+                size is derived from the column count to stay under the 32767 bind
+                parameter limit.
+            - With `use_copy`, rows are streamed with binary COPY into a temporary staging
+                table and applied with a single `INSERT ... SELECT ... ON CONFLICT`, which is
+                much faster for very large batches (nightly syncs). `chunk_size` is ignored.
+                Rows with the same conflict key are collapsed to the last one first, which
+                matches the result of the executemany path.
+            - With `skip_unchanged`, conflicting rows are only updated when at least one
+                update column `IS DISTINCT FROM` the incoming value, so repeated syncs of
+                unchanged data write no new tuple versions, WAL or index entries. Inserted,
+                updated and unchanged counts are then reported in `last_bulk_upsert_stats`.
+            - Throughput of the last call is kept in `last_bulk_upsert_stats`.
         """
+        if not data:
+            return []
+
+        if use_copy:
+            return await self._bulk_upsert_via_copy(
+                data,
+                update_columns=update_columns,
+                update_where=update_where,
+                conflict=conflict,
+                returning_columns=returning_columns,
+                skip_unchanged=skip_unchanged,
+            )
+
+        skip_unchanged = skip_unchanged and not conflict.do_nothing
+        stmt = self.get_upsert_statement(
+            update_columns=update_columns,
+            update_where=update_where,
+            conflict=conflict,
+            returning_columns=returning_columns,
+            skip_unchanged=skip_unchanged,
+        )
+        if chunk_size is None:
+            returns_rows = skip_unchanged or bool(returning_columns)
+            chunk_size = self.get_chunk_size(data) if returns_rows else len(data)
+        stats = BulkUpsertStats()
+        if skip_unchanged:
+            stats.inserted = stats.updated = stats.unchanged = 0
+        rows: list[dict[str, Any]] = []
+
+        start = time.perf_counter()
         try:
-            stmt = insert(self._model).values(data)
+            for offset in range(0, len(data), chunk_size):
+                chunk = data[offset : offset + chunk_size]
+                result = await self._session.execute(stmt, chunk)
+                stats.chunks += 1
+                stats.rows += len(chunk)
+                rows.extend(self._collect_returning(result, len(chunk), stats, returning_columns))
+        except IntegrityError as exc:
+            raise_custom_integrity_exception(exc)
+        else:
+            self._invalidate_cache(self.get_affected_ids(data))
+        finally:
+            stats.seconds = time.perf_counter() - start
+            self.last_bulk_upsert_stats = stats
+            logger.debug(
+                "%s bulk_upsert: %d rows in %d chunks, %.3fs (%.0f rows/s), "
+                "inserted=%s updated=%s unchanged=%s",
+                self,
+                stats.rows,
+                stats.chunks,
+                stats.seconds,
+                stats.rows_per_second,
+                stats.inserted,
+                stats.updated,
+                stats.unchanged,
+            )
 
-            conflict_columns = self.get_conflict_columns(conflict)
+        return rows
 
-            if conflict.do_nothing:
-                stmt = stmt.on_conflict_do_nothing(
-                    index_elements=conflict_columns,
-                    index_where=conflict.where,
-                )
-            else:
-                set_columns = self.get_update_columns(stmt, update_columns)
-                stmt = stmt.on_conflict_do_update(
-                    index_elements=conflict_columns,
-                    index_where=conflict.where,
-                    set_=set_columns,
-                    where=update_where,
-                )
+    async def _bulk_upsert_via_copy(  # noqa: PLR0913
+        self,
+        data: list[dict[str, Any]],
+        *,
+        update_columns: list[str] | None,
+        update_where: BinaryExpression | None,
+        conflict: BulkUpsertConflict,
+        returning_columns: list[Any] | None,
+        skip_unchanged: bool,
+    ) -> list[dict[str, Any]]:
+        column_names = list(data[0])
+        data = self._dedupe_by_conflict_key(data, conflict)
+        skip_unchanged = skip_unchanged and not conflict.do_nothing
+        stats = BulkUpsertStats(chunks=1)
+        if skip_unchanged:
+            stats.inserted = stats.updated = stats.unchanged = 0
+        rows: list[dict[str, Any]] = []
+
+        start = time.perf_counter()
+        try:
+            conn = await self._session.connection()
+            staging_name = await self._create_staging_table(conn, column_names)
 
-            if returning_columns:
-                stmt = stmt.returning(*returning_columns)
+            # COPY bypasses SQLAlchemy's parameter handling, so apply the column types'
+            # bind processors (enums, JSON, type decorators) to the values here.
+            table_columns = self._model.__table__.columns
+            processors = [
+                table_columns[name].type.dialect_impl(conn.dialect).bind_processor(conn.dialect)
+                for name in column_names
+            ]
+            records = (
+                tuple(
+                    processor(row[name]) if processor is not None else row[name]
+                    for name, processor in zip(column_names, processors, strict=True)
+                )
+                for row in data
+            )
+            raw_connection = await conn.get_raw_connection()
+            await raw_connection.driver_connection.copy_records_to_table(
+                staging_name, records=records, columns=column_names
+            )
 
+            staging = table(staging_name, *(column(name) for name in column_names))
+            stmt = self.build_upsert_statement(
+                update_columns=update_columns,
+                update_where=update_where,
+                conflict=conflict,
+                returning_columns=returning_columns,
+                skip_unchanged=skip_unchanged,
+                source=select(*staging.columns),
+            )
             result = await self._session.execute(stmt)
+            stats.rows = len(data)
+            rows.extend(self._collect_returning(result, len(data), stats, returning_columns))
+
+            await self._drop_staging_table(conn, staging_name)
         except IntegrityError as exc:
             raise_custom_integrity_exception(exc)
         else:
-            return result.mappings().all() if result else []
+            self._invalidate_cache(self.get_affected_ids(data))
+        finally:
+            stats.seconds = time.perf_counter() - start
+            self.last_bulk_upsert_stats = stats
+            logger.debug(
+                "%s bulk_upsert (COPY): %d rows in %.3fs (%.0f rows/s), "
+                "inserted=%s updated=%s unchanged=%s",
+                self,
+                stats.rows,
+                stats.seconds,
+                stats.rows_per_second,
+                stats.inserted,
+                stats.updated,
+                stats.unchanged,
+            )
+
+        return rows
+
+    def _dedupe_by_conflict_key(
+        self, data: list[dict[str, Any]], conflict: BulkUpsertConflict
+    ) -> list[dict[str, Any]]:
+        # One INSERT ... SELECT cannot touch the same row twice, while executemany applies
+        # duplicates one after another; keep the last row per conflict key to match it.
+        conflict_columns = self.get_conflict_columns(conflict)
+        if any(name not in data[0] for name in conflict_columns):
+            return data
+
+        deduped = {tuple(row[name] for name in conflict_columns): row for row in data}
+        return list(deduped.values()) if len(deduped) < len(data) else data
+
+    @staticmethod
+    def _collect_returning(
+        result: Result[Any],
+        row_count: int,
+        stats: BulkUpsertStats,
+        returning_columns: list[Any] | None,
+    ) -> list[dict[str, Any]]:
+        if stats.inserted is None:
+            return list(result.mappings().all()) if returning_columns else []
+
+        returned = result.mappings().all()
+        inserted = sum(1 for row in returned if row[INSERTED_FLAG])
+        stats.inserted += inserted
+        stats.updated = (stats.updated or 0) + len(returned) - inserted
+        stats.unchanged = (stats.unchanged or 0) + row_count - len(returned)
+        if not returning_columns:
+            return []
+
+        return [{key: row[key] for key in row if key != INSERTED_FLAG} for row in returned]
+
+    async def _create_staging_table(self, conn: AsyncConnection, column_names: list[str]) -> str:
+        # Same column types as the target table, without constraints, indexes or defaults
+        preparer = conn.dialect.identifier_preparer
+        staging_name = f"_staging_{self._model.__table__.name}_{uuid4().hex[:12]}"
+        staging = preparer.quote(staging_name)
+        columns = ", ".join(preparer.quote(name) for name in column_names)
+        target = preparer.format_table(self._model.__table__)
+        await conn.execute(
+            text(
+                f"CREATE TEMPORARY TABLE {staging} ON COMMIT DROP AS "  # noqa: S608
+                f"SELECT {columns} FROM {target} WITH NO DATA"
+            )
+        )
+        return staging_name
 
-        return []
+    @staticmethod
+    async def _drop_staging_table(conn: AsyncConnection, staging_name: str) -> None:
+        preparer = conn.dialect.identifier_preparer
+        await conn.execute(text(f"DROP TABLE IF EXISTS {preparer.quote(staging_name)}"))
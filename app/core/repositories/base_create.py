@@ -1,9 +1,11 @@
 from __future__ import annotations
 
 from abc import ABC
+from typing import Any
 
 from core.exceptions import raise_custom_integrity_exception
 from core.repositories.base import BaseModelProtocol, BaseRepository
+from sqlalchemy import insert
 from sqlalchemy.exc import IntegrityError
 
 
@@ -16,3 +18,32 @@ class BaseCreateRepository(BaseRepository, ABC):
             raise_custom_integrity_exception(exc)
 
         return model_obj
+
+    async def create_many(
+        self, data: list[dict[str, Any]], *, return_objects: bool = True
+    ) -> list[BaseModelProtocol] | list[int]:
+        """
+        Insert all rows with multi-row `INSERT ... RETURNING` statements (batched by
+        SQLAlchemy's insertmanyvalues to stay under the bind parameter limit) instead of
+        one flush per object.
+
+        Returns the created ORM objects in the order of `data`, or only their ids when
+        `return_objects` is False, which skips ORM hydration entirely.
+        """
+        if not data:
+            return []
+
+        try:
+            if return_objects:
+                stmt = insert(self._model).returning(self._model, sort_by_parameter_order=True)
+                objects = await self._session.scalars(stmt, data)
+                return list(objects.all())
+
+            table = self._model.__table__
+            id_stmt = insert(table).returning(table.c.id, sort_by_parameter_order=True)
+            ids = await self._session.scalars(id_stmt, data)
+            return list(ids.all())
+        except IntegrityError as exc:
+            raise_custom_integrity_exception(exc)
+
+        return []
@@ -1,22 +1,159 @@
 from __future__ import annotations
 
+import asyncio
 from abc import ABC
+from datetime import datetime, timezone
+from typing import TYPE_CHECKING, Any
 
 from core.exceptions import raise_delete_integrity_exception
 from core.repositories.base import BaseModelProtocol, BaseRepository
-from sqlalchemy import delete
+from sqlalchemy import any_, delete, select, update
 from sqlalchemy.exc import IntegrityError
 
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from sqlalchemy.sql import Delete, Update
+    from sqlalchemy.sql.expression import BinaryExpression, ColumnElement
+
+DEFAULT_DELETE_CHUNK_SIZE = 1000
+
 
 class BaseDeleteRepository(BaseRepository, ABC):
-    async def delete(self, model_obj: BaseModelProtocol) -> None:
-        await self.delete_by_id(model_obj.id)
+    async def delete(
+        self, model_obj: BaseModelProtocol, *, deleted_by_id: int | None = None
+    ) -> None:
+        await self.delete_by_id(model_obj.id, deleted_by_id=deleted_by_id)
 
-    async def delete_by_id(self, model_id: int) -> None:
+    async def delete_by_id(
+        self, model_id: int, *, deleted_by_id: int | None = None, hard: bool = False
+    ) -> None:
+        """
+        Delete the row, or only stamp `deleted_at`/`deleted_by_id` when the repository
+        uses soft delete. `hard` forces a real DELETE in soft-delete mode.
+        """
         try:
-            stmt = delete(self.model).where(self._model.id == model_id)
+            stmt = self._build_delete(
+                self._model.id == model_id, deleted_by_id=deleted_by_id, hard=hard
+            )
             await self._session.execute(stmt)
         except IntegrityError as exc:
             raise_delete_integrity_exception(exc)
         else:
             await self._session.flush()
+            self._invalidate_cache([model_id])
+
+    async def delete_many_by_ids(  # noqa: PLR0913
+        self,
+        model_ids: list[int],
+        *,
+        chunk_size: int = DEFAULT_DELETE_CHUNK_SIZE,
+        pause_seconds: float = 0.0,
+        commit: bool = False,
+        deleted_by_id: int | None = None,
+        hard: bool = False,
+    ) -> int:
+        """
+        Delete rows in chunks of `chunk_size` ids and return the number of deleted rows.
+
+        Notes:
+            - By default all chunks run in the caller's transaction. With `commit` every
+                chunk is committed in its own short transaction, which bounds lock
+                duration and replication lag on large purges. This also commits anything
+                else pending in the session, and chunks committed before a failure stay
+                deleted, so only use it with a session dedicated to the purge.
+            - `pause_seconds` sleeps between chunks to give replicas and other
+                transactions room to catch up.
+            - In soft-delete mode rows are stamped instead, unless `hard` is set.
+        """
+        self._validate_chunk_size(chunk_size)
+        deleted = 0
+        for offset in range(0, len(model_ids), chunk_size):
+            if offset and pause_seconds:
+                await asyncio.sleep(pause_seconds)
+
+            chunk = model_ids[offset : offset + chunk_size]
+            stmt = self._build_delete(
+                self._model.id == any_(self._id_array(chunk)),
+                deleted_by_id=deleted_by_id,
+                hard=hard,
+            )
+            deleted += len(await self._delete_chunk(stmt, commit=commit))
+
+        return deleted
+
+    async def delete_by_params(  # noqa: PLR0913
+        self,
+        filters: tuple[BinaryExpression, ...],
+        *,
+        chunk_size: int = DEFAULT_DELETE_CHUNK_SIZE,
+        pause_seconds: float = 0.0,
+        commit: bool = False,
+        deleted_by_id: int | None = None,
+        hard: bool = False,
+        should_stop: Callable[[], bool] | None = None,
+    ) -> int:
+        """
+        Delete every row matching `filters`, `chunk_size` rows per statement, and return
+        the number of deleted rows. See `delete_many_by_ids` for `commit`,
+        `pause_seconds` and `hard`. `should_stop` is checked between chunks; once it
+        returns True the remaining rows are left for a later call.
+        """
+        self._validate_chunk_size(chunk_size)
+        live_filters = () if hard else self._soft_delete_filters()
+        deleted = 0
+        while True:
+            chunk_ids = select(self._model.id).where(*filters, *live_filters).limit(chunk_size)
+            stmt = self._build_delete(
+                self._model.id.in_(chunk_ids.scalar_subquery()),
+                deleted_by_id=deleted_by_id,
+                hard=hard,
+            )
+            chunk_deleted = len(await self._delete_chunk(stmt, commit=commit))
+            deleted += chunk_deleted
+            if chunk_deleted < chunk_size or (should_stop is not None and should_stop()):
+                return deleted
+
+            if pause_seconds:
+                await asyncio.sleep(pause_seconds)
+
+    @staticmethod
+    def _validate_chunk_size(chunk_size: int) -> None:
+        if chunk_size < 1:
+            msg = f"chunk_size must be at least 1, got {chunk_size}"
+            raise ValueError(msg)
+
+    def _build_delete(
+        self,
+        criteria: ColumnElement[bool],
+        *,
+        deleted_by_id: int | None,
+        hard: bool,
+    ) -> Delete | Update:
+        # ORM-enabled statements, so the session syncs instances it already loaded
+        if not self.is_soft_delete or hard:
+            return delete(self._model).where(criteria).returning(self._model.id)
+
+        values: dict[str, Any] = {"deleted_at": datetime.now(timezone.utc)}
+        if deleted_by_id is not None:
+            values["deleted_by_id"] = deleted_by_id
+
+        return (
+            update(self._model)
+            .where(criteria, *self._soft_delete_filters())
+            .values(**values)
+            .returning(self._model.id)
+        )
+
+    async def _delete_chunk(self, stmt: Delete | Update, *, commit: bool) -> list[int]:
+        try:
+            result = await self._session.execute(stmt)
+            deleted_ids = list(result.scalars().all())
+            self._invalidate_cache(deleted_ids)
+            if commit:
+                await self._session.commit()
+        except IntegrityError as exc:
+            raise_delete_integrity_exception(exc)
+            return []
+
+        return deleted_ids
@@ -1,37 +1,365 @@
 from __future__ import annotations
 
+import asyncio
+import json
 from abc import ABC
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
+from core.cache import get_entity_cache, has_pending_invalidation
+from core.exceptions import app_exceptions
 from core.repositories.base import BaseModelProtocol, BaseRepository
-from sqlalchemy import select
+from core.repositories.loader import BatchLoader
+from core.repositories.pagination import KeysetPage, decode_cursor, encode_cursor
+from core.repositories.serialization import dump_column_value, load_column_value
+from sqlalchemy import any_, func, inspect, literal, select, text, tuple_
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.exc import CompileError
+from sqlalchemy.orm import make_transient_to_detached
 
 if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+
+    from sqlalchemy import Column, Row, RowMapping
+    from sqlalchemy.orm import InstrumentedAttribute
+    from sqlalchemy.sql import Select
     from sqlalchemy.sql.expression import BinaryExpression
 
+_LITERAL_DIALECT = postgresql.dialect()
+
 
 class BaseReadRepository(BaseRepository, ABC):
     async def get(self, filters: tuple[BinaryExpression]) -> list[BaseModelProtocol]:
         return await self.get_by_params(filters)
 
     async def get_by_id(self, model_id: int) -> BaseModelProtocol | None:
-        stmt = select(self._model).where(self._model.id == model_id)
+        stmt = self._select().where(self._model.id == model_id)
+        if self.is_cached:
+            cache = get_entity_cache()
+            key = cache.id_key(self._model.__table__.name, model_id)
+            return await self._get_cached(key, "ids", stmt, model_id=model_id)
+
         result = await self._session.execute(stmt)
         return result.scalars().first() or None
 
+    async def get_many_by_ids(self, model_ids: list[int]) -> list[BaseModelProtocol]:
+        if not model_ids:
+            return []
+
+        ids = self._id_array(list(dict.fromkeys(model_ids)))
+        stmt = self._select().where(self._model.id == any_(ids))
+        result = await self._session.execute(stmt)
+        found = {model_obj.id: model_obj for model_obj in result.scalars().all()}
+        return [found[model_id] for model_id in model_ids if model_id in found]
+
+    @property
+    def loader(self) -> BatchLoader:
+        loaders: dict[type, BatchLoader] = self._session.info.setdefault("batch_loaders", {})
+        loader = loaders.get(self._model)
+        if loader is None:
+            # Loaders of all models share one lock: a session runs one statement at a time
+            lock = self._session.info.setdefault("batch_loader_lock", asyncio.Lock())
+            loader = loaders[self._model] = BatchLoader(self, lock)
+        return loader
+
+    async def load_by_id(self, model_id: int) -> BaseModelProtocol | None:
+        return await self.loader.load(model_id)
+
+    async def load_many_by_ids(self, model_ids: list[int]) -> list[BaseModelProtocol | None]:
+        return await self.loader.load_many(model_ids)
+
     async def get_by_params(self, filters: tuple[BinaryExpression]) -> list[BaseModelProtocol]:
-        stmt = select(self._model).where(*filters)
+        stmt = self._select().where(*filters)
         result = await self._session.execute(stmt)
         return result.scalars().all() or []
 
     async def get_one_by_params(
         self, filters: tuple[BinaryExpression]
     ) -> BaseModelProtocol | None:
-        stmt = select(self._model).where(*filters)
+        stmt = self._select().where(*filters)
+        if self.is_cached and (statement := self._compile_literal_statement(stmt)) is not None:
+            cache = get_entity_cache()
+            key = cache.query_key(self._model.__table__.name, statement)
+            return await self._get_cached(key, "queries", stmt)
+
         result = await self._session.execute(stmt)
         return result.scalars().first() or None
 
     async def get_all(self) -> list[BaseModelProtocol]:
-        stmt = select(self._model)
+        stmt = self._select()
         result = await self._session.execute(stmt)
         return result.scalars().all() or []
+
+    async def count(self, filters: tuple[BinaryExpression, ...] = ()) -> int:
+        stmt = self._select(func.count()).select_from(self._model.__table__).where(*filters)
+        result = await self._session.execute(stmt)
+        return result.scalar_one()
+
+    async def exists(self, filters: tuple[BinaryExpression, ...] = ()) -> bool:
+        subquery = self._select(literal(1)).select_from(self._model.__table__).where(*filters)
+        result = await self._session.execute(select(subquery.limit(1).exists()))
+        return bool(result.scalar_one())
+
+    async def estimated_count(self, filters: tuple[BinaryExpression, ...] = ()) -> int:
+        """
+        Approximate row count for list UIs on large tables, in constant time.
+
+        Notes:
+            - Without filters (and without soft delete) this reads `pg_class.reltuples`,
+                which is refreshed by VACUUM / ANALYZE and may lag recent writes.
+            - Otherwise, or when the table was never analyzed, it returns the planner's
+                row estimate from `EXPLAIN`, which is only as good as the table statistics.
+            - Falls back to the exact `count` when the filters cannot be rendered for
+                `EXPLAIN`.
+        """
+        if not filters and not self.is_soft_delete:
+            result = await self._session.execute(
+                text("SELECT reltuples::bigint FROM pg_class WHERE oid = to_regclass(:name)"),
+                {"name": self._model.__table__.fullname},
+            )
+            reltuples = result.scalar()
+            if reltuples is not None and reltuples >= 0:
+                return int(reltuples)
+
+        statement = self._compile_literal_statement(self._select().where(*filters))
+        if statement is None:
+            return await self.count(filters)
+
+        # Driver-level execution: the literal SQL may contain ":" that text() would bind.
+        connection = await self._session.connection()
+        result = await connection.exec_driver_sql(f"EXPLAIN (FORMAT JSON) {statement}")
+        plan = result.scalar_one()
+        if isinstance(plan, str | bytes):
+            plan = json.loads(plan)
+        return int(plan[0]["Plan"]["Plan Rows"])
+
+    async def get_columns_by_params(
+        self,
+        columns: list[str | InstrumentedAttribute[Any]],
+        filters: tuple[BinaryExpression, ...] = (),
+        *,
+        as_mappings: bool = False,
+    ) -> list[Row[Any]] | list[RowMapping]:
+        """
+        Example:
+            rows = await get_columns_by_params(["id", "name"], (Customer.region == "North",))
+            rows[0].name
+
+            rows = await get_columns_by_params([Customer.id, Customer.name], as_mappings=True)
+            rows[0]["name"]
+
+        Notes:
+            - Only the requested columns are selected and rows are returned as named tuples
+                (or read-only mappings with `as_mappings`); no ORM instances are built and
+                nothing is added to the session identity map.
+            - Prefer this over `get_by_params` for read-only list endpoints.
+        """
+        stmt = self._select(*self._get_column_attributes(columns)).where(*filters)
+        result = await self._session.execute(stmt)
+        if as_mappings:
+            return list(result.mappings().all())
+
+        return list(result.all())
+
+    async def stream_by_params(
+        self,
+        filters: tuple[BinaryExpression, ...] = (),
+        *,
+        batch_size: int = 1000,
+        expunge: bool = True,
+    ) -> AsyncIterator[list[BaseModelProtocol]]:
+        """
+        Example:
+            async for customers in stream_by_params((Customer.region == "North",)):
+                await export(customers)
+
+        Notes:
+            - Rows are read through a server-side cursor and yielded in lists of at most
+                `batch_size`, so memory stays bounded by the batch size.
+            - With `expunge` (default) each batch is removed from the session before it is
+                yielded, keeping the identity map from growing during the walk. The yielded
+                objects are detached; lazy loading relationships on them is not possible.
+        """
+        stmt = self._select().where(*filters).execution_options(yield_per=batch_size)
+        result = await self._session.stream(stmt)
+        try:
+            async for partition in result.scalars().partitions(batch_size):
+                batch = list(partition)
+                if expunge:
+                    for model_obj in batch:
+                        self._session.expunge(model_obj)
+                yield batch
+        finally:
+            await result.close()
+
+    async def get_page(
+        self,
+        filters: tuple[BinaryExpression, ...] = (),
+        *,
+        limit: int = 50,
+        cursor: str | None = None,
+        order_by: str = "id",
+        descending: bool = False,
+    ) -> KeysetPage[BaseModelProtocol]:
+        """
+        Example:
+            page = await get_page((Customer.region == "North",), limit=20, order_by="created_at")
+            next_page = await get_page(
+                (Customer.region == "North",),
+                limit=20,
+                order_by="created_at",
+                cursor=page.next_cursor,
+            )
+
+        Notes:
+            - Pages are fetched with a keyset seek (`WHERE (order_by, id) > (:last, :last_id)`)
+                instead of OFFSET, so every page costs the same regardless of depth.
+            - `order_by` should be backed by an index, ideally a composite `(order_by, id)`
+                index; `id` is always appended as the tie-breaker.
+            - The same `filters`, `order_by` and `descending` must be passed with a cursor
+                as were used to obtain it.
+            - `order_by` must be a non-nullable column: a NULL never compares greater or
+                less than the seek key, so rows with NULLs would be skipped.
+        """
+        if limit < 1:
+            raise app_exceptions.BadRequestError(
+                model=self._model.__name__,
+                message=f"Page limit must be at least 1, got {limit}.",
+            )
+
+        key_columns = self._get_keyset_columns(order_by)
+        key_attributes = [getattr(self._model, column.key) for column in key_columns]
+
+        stmt = self._select().where(*filters)
+        if cursor is not None:
+            last_values = decode_cursor(cursor, key_columns)
+            seek_key, seek_values = tuple_(*key_attributes), tuple_(*last_values)
+            stmt = stmt.where(seek_key < seek_values if descending else seek_key > seek_values)
+
+        stmt = stmt.order_by(
+            *(attribute.desc() if descending else attribute.asc() for attribute in key_attributes)
+        ).limit(limit + 1)
+
+        result = await self._session.execute(stmt)
+        items = list(result.scalars().all())
+
+        next_cursor: str | None = None
+        if len(items) > limit:
+            items = items[:limit]
+            last_item = items[-1]
+            next_cursor = encode_cursor(
+                tuple(getattr(last_item, column.key) for column in key_columns)
+            )
+
+        return KeysetPage(items=items, next_cursor=next_cursor)
+
+    def _get_keyset_columns(self, order_by: str) -> tuple[Column[Any], ...]:
+        table_columns = self._model.__table__.columns
+        if order_by not in table_columns:
+            raise app_exceptions.BadRequestError(
+                model=self._model.__name__,
+                message=f"Cannot order {self._model.__name__} by unknown column '{order_by}'.",
+            )
+
+        if order_by == "id":
+            return (table_columns["id"],)
+
+        if table_columns[order_by].nullable:
+            raise app_exceptions.BadRequestError(
+                model=self._model.__name__,
+                message=f"Cannot paginate {self._model.__name__} by nullable column '{order_by}'.",
+            )
+
+        return (table_columns[order_by], table_columns["id"])
+
+    def _get_column_attributes(
+        self, columns: list[str | InstrumentedAttribute[Any]]
+    ) -> list[InstrumentedAttribute[Any]]:
+        attributes = []
+        for column in columns:
+            if not isinstance(column, str):
+                attributes.append(column)
+                continue
+
+            if column not in self._model.__table__.columns:
+                raise app_exceptions.BadRequestError(
+                    model=self._model.__name__,
+                    message=f"Unknown {self._model.__name__} column '{column}'.",
+                )
+            attributes.append(getattr(self._model, column))
+
+        return attributes
+
+    async def _get_cached(
+        self, key: str, kind: str, stmt: Select[Any], *, model_id: int | None = None
+    ) -> BaseModelProtocol | None:
+        """
+        Read through the entity cache, unless the session may hold newer state than the
+        cache: the entity is already loaded in the session, or the session wrote to the
+        table and has not committed yet (invalidation only happens on commit).
+        """
+        table = self._model.__table__.name
+        if (model_id is not None and self._is_loaded(model_id)) or has_pending_invalidation(
+            self._session, table, model_id
+        ):
+            result = await self._session.execute(stmt)
+            return result.scalars().first() or None
+
+        loaded: list[BaseModelProtocol] = []
+
+        async def load() -> dict[str, Any] | None:
+            result = await self._session.execute(stmt)
+            model_obj = result.scalars().first()
+            if model_obj is None:
+                return None
+
+            loaded.append(model_obj)
+            return self._to_cache_payload(model_obj)
+
+        payload = await get_entity_cache().get_or_load(
+            key, table=table, kind=kind, ttl=self.cache_ttl or 0, load=load
+        )
+        if loaded:
+            return loaded[0]
+        if payload is None:
+            return None
+
+        values = self._from_cache_payload(payload)
+        if self._is_loaded(values["id"]):
+            # Never merge a cached copy over the session's instance, which may have changes
+            result = await self._session.execute(stmt)
+            return result.scalars().first() or None
+
+        model_obj = self._model(**values)
+        make_transient_to_detached(model_obj)
+        return await self._session.merge(model_obj, load=False)
+
+    def _is_loaded(self, model_id: Any) -> bool:  # noqa: ANN401
+        return self._session.identity_key(self._model, model_id) in self._session.identity_map
+
+    def _to_cache_payload(self, model_obj: BaseModelProtocol) -> dict[str, Any]:
+        return {
+            attribute.key: dump_column_value(getattr(model_obj, attribute.key))
+            for attribute in inspect(self._model).column_attrs
+        }
+
+    def _from_cache_payload(self, payload: dict[str, Any]) -> dict[str, Any]:
+        return {
+            attribute.key: load_column_value(attribute.columns[0], payload[attribute.key])
+            for attribute in inspect(self._model).column_attrs
+            if attribute.key in payload
+        }
+
+    @staticmethod
+    def _compile_literal_statement(stmt: Select[Any]) -> str | None:
+        try:
+            compiled = stmt.compile(
+                dialect=_LITERAL_DIALECT, compile_kwargs={"literal_binds": True}
+            )
+        except (CompileError, NotImplementedError):
+            return None
+
+        return str(compiled)
+
+    def _select(self, *entities: Any) -> Select[Any]:  # noqa: ANN401
+        stmt = select(*entities) if entities else select(self._model)
+        return stmt.where(*self._soft_delete_filters())
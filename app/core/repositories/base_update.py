@@ -1,14 +1,22 @@
 from __future__ import annotations
 
 from abc import ABC
+from dataclasses import dataclass
+from dataclasses import field as dataclass_field
 from typing import Any
 
 from core.exceptions import app_exceptions, raise_custom_integrity_exception
-from core.repositories.base import BaseModelProtocol, BaseRepository
-from sqlalchemy import select
+from core.repositories.base import MAX_BIND_PARAMETERS, BaseModelProtocol, BaseRepository
+from sqlalchemy import any_, column, inspect, select, update, values
 from sqlalchemy.exc import IntegrityError
 
 
+@dataclass
+class UpdateManyResult:
+    rowcount: int = 0
+    rows: list[dict[str, Any]] = dataclass_field(default_factory=list)
+
+
 class BaseUpdateRepository(BaseRepository, ABC):
     async def update(
         self, model_obj: BaseModelProtocol, update_data: dict[str, Any]
@@ -22,19 +30,170 @@ class BaseUpdateRepository(BaseRepository, ABC):
             await self._session.flush()
         except IntegrityError as exc:
             raise_custom_integrity_exception(exc)
+        else:
+            self._invalidate_cache([model_obj.id])
 
         return model_obj
 
-    async def update_by_id(self, model_id: int, update_data: dict[str, Any]) -> BaseModelProtocol:
-        model_obj = await self._get_by_id(model_id)
+    async def update_by_id(
+        self, model_id: int, update_data: dict[str, Any], *, direct: bool = False
+    ) -> BaseModelProtocol:
+        """
+        With `direct`, the row is updated with a single `UPDATE ... WHERE id = :id
+        RETURNING *` round trip instead of a SELECT followed by a flush. `None` values
+        and unknown fields are ignored in both modes.
+        """
+        if direct:
+            model_obj = await self._update_by_id_returning(model_id, update_data)
+        else:
+            model_obj = await self._get_by_id(model_id)
+            if model_obj is not None:
+                model_obj = await self.update(model_obj, update_data)
+
         if model_obj is None:
             raise app_exceptions.NotFoundError(
                 model=self._model.__name__, context={"id": model_id}
             )
 
-        return await self.update(model_obj, update_data)
+        return model_obj
+
+    async def update_many(
+        self,
+        data: list[dict[str, Any]],
+        *,
+        returning_columns: list[Any] | None = None,
+    ) -> UpdateManyResult:
+        """
+        Example:
+            await update_many(
+                [
+                    {"id": 1, "status": "paid"},
+                    {"id": 2, "status": "refunded", "note": "duplicate"},
+                ],
+                returning_columns=[Order.id, Order.status],
+            )
+
+        Notes:
+            - Every row needs an `id`; its other keys are the values for that row.
+                `None` values and unknown fields are ignored, as in `update`.
+            - Rows are grouped by the set of columns they change and each group runs as
+                `UPDATE t SET ... FROM (VALUES ...) v WHERE t.id = v.id`, chunked to stay
+                under the bind parameter limit.
+            - Objects of the updated rows already loaded in the session are reloaded
+                with one extra SELECT, so they reflect the new values.
+        """
+        table_columns = self._model.__table__.columns
+        groups: dict[tuple[str, ...], list[dict[str, Any]]] = {}
+        for row in data:
+            if row.get("id") is None:
+                raise app_exceptions.BadRequestError(
+                    model=self._model.__name__, message="Every row to update needs an id."
+                )
+            fields = tuple(
+                sorted(
+                    name
+                    for name, value in row.items()
+                    if name != "id" and value is not None and name in table_columns
+                )
+            )
+            if fields:
+                groups.setdefault(fields, []).append(row)
+
+        result = UpdateManyResult()
+        try:
+            for fields, rows in groups.items():
+                chunk_size = max(MAX_BIND_PARAMETERS // (len(fields) + 1), 1)
+                for offset in range(0, len(rows), chunk_size):
+                    await self._update_values_chunk(
+                        fields, rows[offset : offset + chunk_size], returning_columns, result
+                    )
+        except IntegrityError as exc:
+            raise_custom_integrity_exception(exc)
+
+        model_ids = [row["id"] for rows in groups.values() for row in rows]
+        await self._refresh_loaded(model_ids)
+        self._invalidate_cache(model_ids)
+        return result
+
+    async def _update_values_chunk(
+        self,
+        fields: tuple[str, ...],
+        rows: list[dict[str, Any]],
+        returning_columns: list[Any] | None,
+        result: UpdateManyResult,
+    ) -> None:
+        table = self._model.__table__
+        names = ("id", *fields)
+        source = values(
+            *(column(name, table.columns[name].type) for name in names), name="v"
+        ).data([tuple(row[name] for name in names) for row in rows])
+
+        stmt = (
+            update(table)
+            .where(table.columns["id"] == source.columns["id"], *self._soft_delete_filters())
+            .values({name: source.columns[name] for name in fields})
+        )
+        if returning_columns:
+            stmt = stmt.returning(*returning_columns)
+
+        chunk_result = await self._session.execute(stmt)
+        if returning_columns:
+            returned = chunk_result.mappings().all()
+            result.rows.extend(returned)
+            result.rowcount += len(returned)
+        else:
+            result.rowcount += chunk_result.rowcount
+
+    async def _refresh_loaded(self, model_ids: list[int]) -> None:
+        # Reload instead of expiring: an expired attribute would lazy-load on access,
+        # which raises MissingGreenlet under asyncio.
+        mapper = inspect(self._model)
+        identity_map = self._session.identity_map
+        loaded_ids = [
+            model_id
+            for model_id in model_ids
+            if mapper.identity_key_from_primary_key([model_id]) in identity_map
+        ]
+        if not loaded_ids:
+            return
+
+        stmt = (
+            select(self._model)
+            .where(self._model.id == any_(self._id_array(loaded_ids)))
+            .execution_options(populate_existing=True)
+        )
+        await self._session.execute(stmt)
+
+    async def _update_by_id_returning(
+        self, model_id: int, update_data: dict[str, Any]
+    ) -> BaseModelProtocol | None:
+        column_attrs = inspect(self._model).column_attrs
+        update_values = {
+            field: value
+            for field, value in update_data.items()
+            if value is not None and field in column_attrs
+        }
+        if not update_values:
+            return await self._get_by_id(model_id)
+
+        stmt = (
+            update(self._model)
+            .where(self._model.id == model_id, *self._soft_delete_filters())
+            .values(**update_values)
+            .returning(self._model)
+        )
+        try:
+            result = await self._session.scalars(stmt)
+            model_obj: BaseModelProtocol | None = result.first()
+        except IntegrityError as exc:
+            raise_custom_integrity_exception(exc)
+            return None
+
+        if model_obj is not None:
+            self._invalidate_cache([model_id])
+        return model_obj
 
     async def _get_by_id(self, model_id: int) -> BaseModelProtocol | None:
-        stmt = select(self._model).where(self._model.id == model_id)
+        stmt = select(self._model).where(self._model.id == model_id, *self._soft_delete_filters())
         result = await self._session.execute(stmt)
         return result.scalars().first() or None
@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from core.repositories.base import BaseModelProtocol
+    from core.repositories.base_read import BaseReadRepository
+
+
+class BatchLoader:
+    """
+    Coalesces `load`/`load_many` calls made within one event-loop tick into a single
+    `WHERE id = ANY(:ids)` query and memoizes the results for the lifetime of the session.
+
+    Obtain it through `BaseReadRepository.loader`, which keeps one loader per model in
+    `session.info`, so it is scoped to the request session. Fetches run in their own
+    tasks, so they hold `lock` (shared by the session's loaders) while they execute.
+    """
+
+    def __init__(self, repository: BaseReadRepository, lock: asyncio.Lock) -> None:
+        self._repository = repository
+        self._lock = lock
+        self._memo: dict[int, BaseModelProtocol | None] = {}
+        self._pending: dict[int, asyncio.Future[BaseModelProtocol | None]] = {}
+        self._dispatch_tasks: set[asyncio.Task[None]] = set()
+        self._dispatch_scheduled = False
+
+    async def load(self, model_id: int) -> BaseModelProtocol | None:
+        if model_id in self._memo:
+            return self._memo[model_id]
+
+        # Callers of the same id share one future: shield it, so a cancelled caller
+        # does not cancel it for the others.
+        return await asyncio.shield(self._enqueue(model_id))
+
+    async def load_many(self, model_ids: Iterable[int]) -> list[BaseModelProtocol | None]:
+        return list(await asyncio.gather(*(self.load(model_id) for model_id in model_ids)))
+
+    def prime(self, model_obj: BaseModelProtocol) -> None:
+        self._memo[model_obj.id] = model_obj
+
+    def clear(self, model_ids: Iterable[int] | None = None) -> None:
+        if model_ids is None:
+            self._memo.clear()
+            return
+
+        for model_id in model_ids:
+            self._memo.pop(model_id, None)
+
+    def _enqueue(self, model_id: int) -> asyncio.Future[BaseModelProtocol | None]:
+        future = self._pending.get(model_id)
+        if future is not None:
+            return future
+
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending[model_id] = future
+        if not self._dispatch_scheduled:
+            self._dispatch_scheduled = True
+            loop.call_soon(self._dispatch)
+
+        return future
+
+    def _dispatch(self) -> None:
+        batch, self._pending = self._pending, {}
+        self._dispatch_scheduled = False
+        task = asyncio.get_running_loop().create_task(self._fetch(batch))
+        self._dispatch_tasks.add(task)
+        task.add_done_callback(self._dispatch_tasks.discard)
+
+    async def _fetch(self, batch: dict[int, asyncio.Future[BaseModelProtocol | None]]) -> None:
+        try:
+            async with self._lock:
+                model_objs = await self._repository.get_many_by_ids(list(batch))
+        except Exception as exc:  # noqa: BLE001
+            for future in batch.values():
+                if not future.done():
+                    future.set_exception(exc)
+            return
+
+        found = {model_obj.id: model_obj for model_obj in model_objs}
+        for model_id, future in batch.items():
+            model_obj = found.get(model_id)
+            self._memo[model_id] = model_obj
+            if not future.done():
+                future.set_result(model_obj)
@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+import base64
+import binascii
+import json
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Generic, TypeVar
+
+from core.exceptions import app_exceptions
+from core.repositories.serialization import dump_column_value, load_column_value
+
+if TYPE_CHECKING:
+    from sqlalchemy import Column
+
+T = TypeVar("T")
+
+
+@dataclass
+class KeysetPage(Generic[T]):
+    items: list[T] = field(default_factory=list)
+    next_cursor: str | None = None
+
+    @property
+    def has_more(self) -> bool:
+        return self.next_cursor is not None
+
+
+def encode_cursor(values: tuple[Any, ...]) -> str:
+    payload = json.dumps([dump_column_value(value) for value in values], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, columns: tuple[Column[Any], ...]) -> tuple[Any, ...]:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        if not isinstance(values, list) or len(values) != len(columns):
+            raise ValueError  # noqa: TRY301
+        return tuple(
+            load_column_value(column, value) for column, value in zip(columns, values, strict=True)
+        )
+    except (ValueError, TypeError, binascii.Error):
+        raise app_exceptions.BadRequestError(
+            model="Cursor", message="Invalid pagination cursor.", context={"cursor": cursor}
+        )
@@ -0,0 +1,46 @@
+from __future__ import annotations
+
+from datetime import date, datetime, time, timedelta
+from decimal import Decimal
+from enum import Enum
+from typing import TYPE_CHECKING, Any
+from uuid import UUID
+
+if TYPE_CHECKING:
+    from sqlalchemy import Column
+
+
+def dump_column_value(value: Any) -> Any:  # noqa: ANN401
+    """Convert a column value to a JSON compatible value."""
+    if isinstance(value, datetime | date | time):
+        return value.isoformat()
+    if isinstance(value, timedelta):
+        return value.total_seconds()
+    if isinstance(value, Decimal | UUID):
+        return str(value)
+    if isinstance(value, Enum):
+        return value.value
+    return value
+
+
+def load_column_value(column: Column[Any], value: Any) -> Any:  # noqa: ANN401, PLR0911
+    """Restore a value produced by `dump_column_value` using the column python type."""
+    if value is None:
+        return None
+
+    try:
+        python_type = column.type.python_type
+    except NotImplementedError:
+        return value
+
+    if python_type is datetime:
+        return datetime.fromisoformat(value)
+    if python_type is date:
+        return date.fromisoformat(value)
+    if python_type is time:
+        return time.fromisoformat(value)
+    if python_type is timedelta:
+        return timedelta(seconds=value)
+    if python_type in (Decimal, UUID) or issubclass(python_type, Enum):
+        return python_type(value)
+    return value
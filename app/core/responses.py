@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+import json
+from decimal import Decimal
+from functools import lru_cache
+from typing import Any
+
+import orjson
+import pydantic_core
+from config import app_config
+from pydantic import BaseModel
+from starlette.responses import JSONResponse
+
+# datetime, date, UUID, dataclasses and enums are serialized natively by orjson.
+ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+
+def _orjson_default(value: Any) -> Any:  # noqa: ANN401
+    if isinstance(value, BaseModel):
+        return value.model_dump(mode="json")
+    if isinstance(value, Decimal):
+        return str(value)
+    if isinstance(value, set | frozenset):
+        return list(value)
+    raise TypeError
+
+
+def _lenient_default(value: Any) -> Any:  # noqa: ANN401
+    try:
+        return _orjson_default(value)
+    except TypeError:
+        return str(value)
+
+
+def dumps(content: Any) -> bytes:  # noqa: ANN401
+    """
+    Serialize `content` to JSON bytes.
+
+    Pydantic models, and lists of them, go through pydantic-core's serializer, so
+    already-validated models skip `jsonable_encoder` and the per-field Python walk.
+    Anything else goes through orjson.
+    """
+    if isinstance(content, BaseModel) or (
+        isinstance(content, list | tuple) and content and isinstance(content[0], BaseModel)
+    ):
+        return pydantic_core.to_json(content)
+    return orjson.dumps(content, default=_orjson_default, option=ORJSON_OPTIONS)
+
+
+def dumps_lenient(content: Any) -> bytes:  # noqa: ANN401
+    """
+    Serialize `content` to JSON bytes without failing, for payloads that must always be
+    sent (e.g. error responses): unsupported values are rendered with `str`, and content
+    orjson rejects outright (integers beyond 64 bits) falls back to the stdlib encoder.
+    """
+    try:
+        return orjson.dumps(content, default=_lenient_default, option=ORJSON_OPTIONS)
+    except orjson.JSONEncodeError:
+        return json.dumps(content, default=str, separators=(",", ":")).encode()
+
+
+class ORJSONResponse(JSONResponse):
+    """
+    JSON response rendered with orjson (or pydantic-core for models).
+
+    As the default response class it only replaces the final encoding step: FastAPI
+    still runs `jsonable_encoder` on whatever the endpoint returns. That pass is skipped
+    only when an endpoint returns `ORJSONResponse(model)` itself. `bytes` content is
+    sent as already-encoded JSON.
+    """
+
+    def render(self, content: Any) -> bytes:  # noqa: ANN401
+        if isinstance(content, bytes):
+            return content
+        return dumps(content)
+
+
+@lru_cache(maxsize=1)
+def get_default_response_class() -> type[JSONResponse]:
+    if app_config.JSON_RESPONSE_CLASS == "orjson":
+        return ORJSONResponse
+    return JSONResponse
@@ -7,7 +7,7 @@ from core.repositories import BulkUpsertConflict
 from core.services.base import BaseService
 
 if TYPE_CHECKING:
-    from core.repositories import BaseBulkUpsertRepository, BaseDBModel
+    from core.repositories import BaseBulkUpsertRepository, BaseDBModel, BulkUpsertStats
     from sqlalchemy.ext.asyncio import AsyncSession
     from sqlalchemy.sql.elements import BinaryExpression
 
@@ -26,7 +26,11 @@ class BaseBulkUpsertService(BaseService, ABC):
         self._repository: BaseBulkUpsertRepository = repository(session=session, model=model)
         super().__init__(session=session, model=model, repository=repository)
 
-    async def bulk_upsert(
+    @property
+    def last_bulk_upsert_stats(self) -> BulkUpsertStats | None:
+        return self._repository.last_bulk_upsert_stats
+
+    async def bulk_upsert(  # noqa: PLR0913
         self,
         data: list[dict[str, Any]],
         *,
@@ -34,6 +38,9 @@ class BaseBulkUpsertService(BaseService, ABC):
         update_where: BinaryExpression | None = None,
         conflict: BulkUpsertConflict = DEFAULT_CONFLICT,
         returning_columns: list[Any] | None = None,
+        chunk_size: int | None = None,
+        use_copy: bool = False,
+        skip_unchanged: bool = False,
     ) -> list[dict[str, Any]]:
         """
         Example:
@@ -70,6 +77,20 @@ class BaseBulkUpsertService(BaseService, ABC):
                 if a conflict is detected.
             - `returning_columns` allows you to specify which columns to return
                 after the upsert operation.
+            - `data` is executed as executemany batches of `chunk_size` rows. Every row
+                must have the same keys. Without RETURNING each row is bound separately, so
+                by default all rows go in one batch. With RETURNING (or `skip_unchanged`)
+                rows are rendered into multi-row VALUES statements, so the default chunk
+                size is derived from the column count to stay under the 32767 bind
+                parameter limit.
+            - With `use_copy`, rows are streamed with binary COPY into a temporary staging
+                table and applied with a single `INSERT ... SELECT ... ON CONFLICT`, which is
+                much faster for very large batches (nightly syncs). `chunk_size` is ignored.
+                Rows with the same conflict key are collapsed to the last one first, which
+                matches the result of the executemany path.
+            - With `skip_unchanged`, conflicting rows are only updated when at least one
+                update column `IS DISTINCT FROM` the incoming value, so repeated syncs of
+                unchanged data write no new tuple versions, WAL or index entries.
         """
         return await self._repository.bulk_upsert(
             data=data,
@@ -77,4 +98,7 @@ class BaseBulkUpsertService(BaseService, ABC):
             update_where=update_where,
             conflict=conflict,
             returning_columns=returning_columns,
+            chunk_size=chunk_size,
+            use_copy=use_copy,
+            skip_unchanged=skip_unchanged,
         )
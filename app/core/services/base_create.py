@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from abc import ABC
 from datetime import datetime, timezone
-from typing import TYPE_CHECKING, Generic, TypeVar
+from typing import TYPE_CHECKING, Any, Generic, TypeVar
 
 from core.exceptions import app_exceptions
 from core.services.base import BaseService
@@ -35,6 +35,12 @@ class BaseCreateService(Generic[CreateSchemaType], BaseService, ABC):
 
         return created_entity
 
+    async def create_many(
+        self, create_schemas: list[CreateSchemaType], *, return_objects: bool = True
+    ) -> list[BaseModelProtocol] | list[int]:
+        data = self.__prepare_create_many(create_schemas)
+        return await self._repository.create_many(data, return_objects=return_objects)
+
     async def __prepare_create(self, create_schema: CreateSchemaType) -> BaseModelProtocol:
         model_obj: BaseModelProtocol = self._model(**create_schema.model_dump())
         if hasattr(model_obj, "created_at"):
@@ -42,3 +48,14 @@ class BaseCreateService(Generic[CreateSchemaType], BaseService, ABC):
             model_obj.created_at = now
 
         return model_obj
+
+    def __prepare_create_many(
+        self, create_schemas: list[CreateSchemaType]
+    ) -> list[dict[str, Any]]:
+        data = [create_schema.model_dump() for create_schema in create_schemas]
+        if hasattr(self._model, "created_at"):
+            now = datetime.now(timezone.utc)
+            for row in data:
+                row["created_at"] = now
+
+        return data
@@ -3,11 +3,15 @@ from __future__ import annotations
 from abc import ABC
 from typing import TYPE_CHECKING
 
+from core.repositories import DEFAULT_DELETE_CHUNK_SIZE
 from core.services.base import BaseService
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+
     from core.repositories import BaseDBModel, BaseDeleteRepository, BaseModelProtocol
     from sqlalchemy.ext.asyncio import AsyncSession
+    from sqlalchemy.sql.expression import BinaryExpression
 
 
 class BaseDeleteService(BaseService, ABC):
@@ -22,8 +26,52 @@ class BaseDeleteService(BaseService, ABC):
         self._repository: BaseDeleteRepository = repository(session=session, model=model)
         super().__init__(session=session, model=model, repository=repository)
 
-    async def delete(self, model_obj: BaseModelProtocol) -> None:
-        await self._repository.delete(model_obj)
+    async def delete(
+        self, model_obj: BaseModelProtocol, *, deleted_by_id: int | None = None
+    ) -> None:
+        await self._repository.delete(model_obj, deleted_by_id=deleted_by_id)
+
+    async def delete_by_id(
+        self, model_id: int, *, deleted_by_id: int | None = None, hard: bool = False
+    ) -> None:
+        await self._repository.delete_by_id(model_id, deleted_by_id=deleted_by_id, hard=hard)
 
-    async def delete_by_id(self, model_id: int) -> None:
-        await self._repository.delete_by_id(model_id)
+    async def delete_many_by_ids(  # noqa: PLR0913
+        self,
+        model_ids: list[int],
+        *,
+        chunk_size: int = DEFAULT_DELETE_CHUNK_SIZE,
+        pause_seconds: float = 0.0,
+        commit: bool = False,
+        deleted_by_id: int | None = None,
+        hard: bool = False,
+    ) -> int:
+        return await self._repository.delete_many_by_ids(
+            model_ids,
+            chunk_size=chunk_size,
+            pause_seconds=pause_seconds,
+            commit=commit,
+            deleted_by_id=deleted_by_id,
+            hard=hard,
+        )
+
+    async def delete_by_params(  # noqa: PLR0913
+        self,
+        filters: tuple[BinaryExpression, ...],
+        *,
+        chunk_size: int = DEFAULT_DELETE_CHUNK_SIZE,
+        pause_seconds: float = 0.0,
+        commit: bool = False,
+        deleted_by_id: int | None = None,
+        hard: bool = False,
+        should_stop: Callable[[], bool] | None = None,
+    ) -> int:
+        return await self._repository.delete_by_params(
+            filters,
+            chunk_size=chunk_size,
+            pause_seconds=pause_seconds,
+            commit=commit,
+            deleted_by_id=deleted_by_id,
+            hard=hard,
+            should_stop=should_stop,
+        )
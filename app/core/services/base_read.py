@@ -1,13 +1,22 @@
 from __future__ import annotations
 
 from abc import ABC
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 from core.services.base import BaseService
 
 if TYPE_CHECKING:
-    from core.repositories import BaseDBModel, BaseModelProtocol, BaseReadRepository
+    from collections.abc import AsyncIterator
+
+    from core.repositories import (
+        BaseDBModel,
+        BaseModelProtocol,
+        BaseReadRepository,
+        KeysetPage,
+    )
+    from sqlalchemy import Row, RowMapping
     from sqlalchemy.ext.asyncio import AsyncSession
+    from sqlalchemy.orm import InstrumentedAttribute
     from sqlalchemy.sql.expression import BinaryExpression
 
 
@@ -29,6 +38,21 @@ class BaseReadService(BaseService, ABC):
     async def get_by_id(self, model_id: int) -> BaseModelProtocol | None:
         return await self._repository.get_by_id(model_id)
 
+    async def get_many_by_ids(self, model_ids: list[int]) -> list[BaseModelProtocol]:
+        return await self._repository.get_many_by_ids(model_ids)
+
+    async def load_by_id(self, model_id: int) -> BaseModelProtocol | None:
+        """
+        Batched, memoized variant of `get_by_id`.
+
+        Calls made from concurrent coroutines in the same event-loop tick are fetched
+        with one query, and ids already loaded in this session are served from memory.
+        """
+        return await self._repository.load_by_id(model_id)
+
+    async def load_many_by_ids(self, model_ids: list[int]) -> list[BaseModelProtocol | None]:
+        return await self._repository.load_many_by_ids(model_ids)
+
     async def get_by_params(self, filters: tuple[BinaryExpression]) -> list[BaseModelProtocol]:
         return await self._repository.get_by_params(filters)
 
@@ -39,3 +63,49 @@ class BaseReadService(BaseService, ABC):
 
     async def get_all(self) -> list[BaseModelProtocol]:
         return await self._repository.get_all()
+
+    async def count(self, filters: tuple[BinaryExpression, ...] = ()) -> int:
+        return await self._repository.count(filters)
+
+    async def exists(self, filters: tuple[BinaryExpression, ...] = ()) -> bool:
+        return await self._repository.exists(filters)
+
+    async def estimated_count(self, filters: tuple[BinaryExpression, ...] = ()) -> int:
+        return await self._repository.estimated_count(filters)
+
+    async def get_page(
+        self,
+        filters: tuple[BinaryExpression, ...] = (),
+        *,
+        limit: int = 50,
+        cursor: str | None = None,
+        order_by: str = "id",
+        descending: bool = False,
+    ) -> KeysetPage[BaseModelProtocol]:
+        return await self._repository.get_page(
+            filters,
+            limit=limit,
+            cursor=cursor,
+            order_by=order_by,
+            descending=descending,
+        )
+
+    async def get_columns_by_params(
+        self,
+        columns: list[str | InstrumentedAttribute[Any]],
+        filters: tuple[BinaryExpression, ...] = (),
+        *,
+        as_mappings: bool = False,
+    ) -> list[Row[Any]] | list[RowMapping]:
+        return await self._repository.get_columns_by_params(
+            columns, filters, as_mappings=as_mappings
+        )
+
+    def stream_by_params(
+        self,
+        filters: tuple[BinaryExpression, ...] = (),
+        *,
+        batch_size: int = 1000,
+        expunge: bool = True,
+    ) -> AsyncIterator[list[BaseModelProtocol]]:
+        return self._repository.stream_by_params(filters, batch_size=batch_size, expunge=expunge)
@@ -7,7 +7,12 @@ from core.repositories import BaseModelProtocol
 from core.services.base import BaseService
 
 if TYPE_CHECKING:
-    from core.repositories import BaseDBModel, BaseModelProtocol, BaseUpdateRepository
+    from core.repositories import (
+        BaseDBModel,
+        BaseModelProtocol,
+        BaseUpdateRepository,
+        UpdateManyResult,
+    )
     from sqlalchemy.ext.asyncio import AsyncSession
 
 
@@ -28,5 +33,15 @@ class BaseUpdateService(BaseService, ABC):
     ) -> BaseModelProtocol:
         return await self._repository.update(model_obj, update_data)
 
-    async def update_by_id(self, model_id: int, update_data: dict[str, Any]) -> BaseModelProtocol:
-        return await self._repository.update_by_id(model_id, update_data)
+    async def update_by_id(
+        self, model_id: int, update_data: dict[str, Any], *, direct: bool = False
+    ) -> BaseModelProtocol:
+        return await self._repository.update_by_id(model_id, update_data, direct=direct)
+
+    async def update_many(
+        self,
+        data: list[dict[str, Any]],
+        *,
+        returning_columns: list[Any] | None = None,
+    ) -> UpdateManyResult:
+        return await self._repository.update_many(data, returning_columns=returning_columns)
@@ -1,21 +1,61 @@
+from __future__ import annotations
+
+import asyncio
+import contextlib
+from contextlib import asynccontextmanager
+from typing import TYPE_CHECKING, Any
+
 import uvicorn
+from core.cache import close_entity_cache
+from core.database import dispose_engine, get_pool_stats
 from core.exceptions import bind_exception_handler
-from fastapi import FastAPI
-from middlewares import add_middleware
+from core.metrics import mark_process_dead, render_metrics, run_runtime_metrics
+from core.responses import get_default_response_class
+from fastapi import Depends, FastAPI, Response
+from middlewares import add_middleware, bind_route_log_context
 
 from app.config import app_config
 
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+
+
+@asynccontextmanager
+async def lifespan(_: FastAPI) -> AsyncIterator[None]:
+    runtime_metrics = asyncio.create_task(
+        run_runtime_metrics(app_config.METRICS_RUNTIME_INTERVAL_SECONDS)
+    )
+    yield
+    runtime_metrics.cancel()
+    with contextlib.suppress(asyncio.CancelledError):
+        await runtime_metrics
+    await close_entity_cache()
+    await dispose_engine()
+    mark_process_dead()
+
 
 def add_router(app: FastAPI) -> None:
     @app.get("/health-check")
     def read_root_health_check() -> dict[str, str]:
         return {"data": "success!"}
 
+    @app.get("/health-check/db-pool", include_in_schema=False)
+    def read_db_pool_health_check() -> dict[str, Any]:
+        return {"data": get_pool_stats()}
+
+    @app.get("/metrics", include_in_schema=False)
+    def read_metrics() -> Response:
+        content, media_type = render_metrics()
+        return Response(content=content, media_type=media_type)
+
 
 def get_app() -> FastAPI:
     app = FastAPI(
         title=app_config.PROJECT_NAME,
         docs_url="/api/docs",
+        lifespan=lifespan,
+        dependencies=[Depends(bind_route_log_context)],
+        default_response_class=get_default_response_class(),
     )
     add_router(app=app)
     add_middleware(app=app)
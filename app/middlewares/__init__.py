@@ -1,3 +1,4 @@
 from middlewares.add_middleware import add_middleware
+from middlewares.request_context import bind_route_log_context
 
-__all__ = ["add_middleware"]
+__all__ = ["add_middleware", "bind_route_log_context"]
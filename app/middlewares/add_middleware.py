@@ -1,11 +1,9 @@
 from config import app_config
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from middlewares.process_time import add_process_time_middleware
-
-
-def is_local_development() -> bool:
-    return app_config.is_local_dev
+from middlewares.db_timing import DatabaseTimingMiddleware
+from middlewares.process_time import ProcessTimeMiddleware
+from middlewares.request_context import RequestContextMiddleware
 
 
 def add_middleware(app: FastAPI) -> None:
@@ -17,5 +15,10 @@ def add_middleware(app: FastAPI) -> None:
         allow_headers=["*"],
     )
 
-    if is_local_development():
-        add_process_time_middleware(app=app)
+    if app_config.DB_INSTRUMENTATION_ENABLED:
+        app.add_middleware(DatabaseTimingMiddleware)
+
+    app.add_middleware(RequestContextMiddleware)
+
+    # Added last so it is the outermost middleware and times everything below it.
+    app.add_middleware(ProcessTimeMiddleware)
@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from config import app_config, logger
+from core.database import reset_query_stats, start_query_stats
+from starlette.datastructures import MutableHeaders
+
+if TYPE_CHECKING:
+    from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+
+class DatabaseTimingMiddleware:
+    """
+    Pure ASGI middleware that reports per-request database usage.
+
+    Adds `Server-Timing: db;dur=<ms>;desc="<n> queries"` to the response, logs the
+    request's query count and DB time as structured fields, and warns when the same
+    statement runs `DB_REPEATED_QUERY_THRESHOLD` times or more (likely N+1).
+    Queries issued after the response headers are sent (streaming bodies) are logged
+    but not included in the header.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats, token = start_query_stats()
+
+        async def send_with_timing(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                headers = MutableHeaders(scope=message)
+                headers.append(
+                    "Server-Timing",
+                    f'db;dur={stats.total_seconds * 1000:.3f};desc="{stats.count} queries"',
+                )
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            reset_query_stats(token)
+            if stats.count:
+                path = scope["path"]
+                fields = {"path": path, **stats.as_log_fields()}
+                logger.debug(
+                    "%s %s ran %s queries in %.1f ms",
+                    scope["method"],
+                    path,
+                    stats.count,
+                    stats.total_seconds * 1000,
+                    extra=fields,
+                )
+                repeated = stats.repeated_statements(app_config.DB_REPEATED_QUERY_THRESHOLD)
+                for statement, count in repeated.items():
+                    logger.warning(
+                        "Possible N+1 on %s %s: statement ran %s times: %s",
+                        scope["method"],
+                        path,
+                        count,
+                        statement,
+                        extra={**fields, "db_statement_repeats": count},
+                    )
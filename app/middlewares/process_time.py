@@ -1,14 +1,54 @@
+from __future__ import annotations
+
 import time
-from collections.abc import Callable
+from typing import TYPE_CHECKING
+
+from core.metrics import REQUEST_LATENCY, REQUESTS_IN_PROGRESS, RESPONSES, get_route_label
+from starlette.datastructures import MutableHeaders
+
+if TYPE_CHECKING:
+    from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+
+class ProcessTimeMiddleware:
+    """
+    Pure ASGI middleware that times every HTTP request.
+
+    Adds `Server-Timing: app;dur=<ms>` and `X-Response-Time` (time until the response
+    headers are sent) and records the full request duration, including the streamed
+    body, in the `http_request_duration_seconds` histogram by route template, along
+    with in-flight requests and response status counts.
+    The response body is passed through untouched.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
 
-from fastapi import FastAPI, Request
+        start_ns = time.perf_counter_ns()
+        status_code = 500
 
+        async def send_with_timing(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                duration_ms = (time.perf_counter_ns() - start_ns) / 1_000_000
+                headers = MutableHeaders(scope=message)
+                headers.append("Server-Timing", f"app;dur={duration_ms:.3f}")
+                headers["X-Response-Time"] = f"{duration_ms:.3f} ms"
+            await send(message)
 
-def add_process_time_middleware(app: FastAPI) -> None:
-    @app.middleware("http")
-    async def add_process_time_header(request: Request, call_next: Callable):  # noqa: ANN202
-        start_time = time.time()
-        response = await call_next(request)
-        process_time = time.time() - start_time
-        response.headers["X-Response-Time"] = f"{process_time:.3f} seconds"
-        return response
+        REQUESTS_IN_PROGRESS.inc()
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            REQUESTS_IN_PROGRESS.dec()
+            method, route = scope["method"], get_route_label(scope)
+            REQUEST_LATENCY.labels(method, route).observe(
+                (time.perf_counter_ns() - start_ns) / 1_000_000_000
+            )
+            RESPONSES.labels(method, route, str(status_code)).inc()
@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+import re
+import uuid
+from typing import TYPE_CHECKING
+
+from config.log_formatters import bind_log_context, reset_log_context, update_log_context
+from starlette.datastructures import Headers, MutableHeaders
+
+if TYPE_CHECKING:
+    from starlette.requests import Request
+    from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+REQUEST_ID_HEADER = "X-Request-ID"
+# Incoming ids end up in logs and response headers, so only accept short, plain tokens.
+_REQUEST_ID_PATTERN = re.compile(r"[A-Za-z0-9._:+/=-]{1,128}")
+
+
+class RequestContextMiddleware:
+    """
+    Pure ASGI middleware that binds `request_id`, `method` and `path` to every log
+    record emitted while the request is handled and echoes the id in `X-Request-ID`.
+    An incoming `X-Request-ID` is reused so ids can be traced across services, unless
+    it is longer than 128 characters or contains characters outside `[A-Za-z0-9._:+/=-]`.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        request_id = get_request_id(Headers(scope=scope).get(REQUEST_ID_HEADER))
+        token = bind_log_context(request_id=request_id, method=scope["method"], path=scope["path"])
+
+        async def send_with_request_id(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                MutableHeaders(scope=message)[REQUEST_ID_HEADER] = request_id
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_request_id)
+        finally:
+            reset_log_context(token)
+
+
+def get_request_id(incoming: str | None) -> str:
+    if incoming is not None and _REQUEST_ID_PATTERN.fullmatch(incoming):
+        return incoming
+    return uuid.uuid4().hex
+
+
+async def bind_route_log_context(request: Request) -> None:
+    """App-wide dependency: add the matched route template once routing is done."""
+    route = request.scope.get("route")
+    if route is not None:
+        update_log_context(route=getattr(route, "path_format", None))
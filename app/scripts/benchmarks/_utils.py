@@ -0,0 +1,129 @@
+from __future__ import annotations
+
+import time
+import tracemalloc
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import TYPE_CHECKING, Any, ClassVar
+
+from sqlalchemy import DateTime, String
+from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable, Sequence
+
+    from sqlalchemy.ext.asyncio import AsyncEngine
+
+
+class BenchmarkBase(DeclarativeBase):
+    """
+    Standalone base: `BaseDBModel` only declares its columns for type checkers, so
+    SQLAlchemy cannot resolve its annotations at runtime. Timestamps are timezone-aware,
+    as stamped by the services.
+    """
+
+    type_annotation_map: ClassVar[dict[Any, Any]] = {datetime: DateTime(timezone=True)}
+
+
+class BenchmarkRecord(BenchmarkBase):
+    __tablename__ = "benchmark_record"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    name: Mapped[str] = mapped_column(String(64))
+    status: Mapped[str] = mapped_column(String(16), index=True)
+    score: Mapped[int]
+    created_at: Mapped[datetime | None]
+    updated_at: Mapped[datetime | None]
+    deleted_at: Mapped[datetime | None]
+    created_by_id: Mapped[int | None]
+    updated_by_id: Mapped[int | None]
+    deleted_by_id: Mapped[int | None]
+
+
+def make_records(count: int) -> list[dict[str, Any]]:
+    now = datetime.now(timezone.utc)
+    return [
+        {
+            "name": f"record-{index}",
+            "status": "active" if index % 2 else "inactive",
+            "score": index,
+            "created_at": now,
+            "updated_at": now,
+            "created_by_id": 1,
+            "updated_by_id": 1,
+        }
+        for index in range(count)
+    ]
+
+
+async def create_benchmark_table(engine: AsyncEngine) -> None:
+    async with engine.begin() as conn:
+        await conn.run_sync(BenchmarkRecord.__table__.drop, checkfirst=True)
+        await conn.run_sync(BenchmarkRecord.__table__.create)
+
+
+async def drop_benchmark_table(engine: AsyncEngine) -> None:
+    async with engine.begin() as conn:
+        await conn.run_sync(BenchmarkRecord.__table__.drop, checkfirst=True)
+
+
+@dataclass
+class BenchmarkResult:
+    name: str
+    items: int
+    seconds: float
+    peak_bytes: int
+
+    @property
+    def items_per_second(self) -> float:
+        return self.items / self.seconds if self.seconds else 0.0
+
+
+async def measure_async(
+    name: str, items: int, func: Callable[[], Awaitable[Any]], *, repeat: int = 3
+) -> BenchmarkResult:
+    """
+    Best wall time of `repeat` runs, plus peak traced memory from one extra run.
+
+    tracemalloc hooks every allocation and slows the code under test, so it is only
+    enabled for the memory run, never while timing.
+    """
+    best_seconds: float | None = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        await func()
+        seconds = time.perf_counter() - start
+        if best_seconds is None or seconds < best_seconds:
+            best_seconds = seconds
+
+    assert best_seconds is not None  # noqa: S101
+    tracemalloc.start()
+    try:
+        await func()
+        _, peak_bytes = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return BenchmarkResult(name=name, items=items, seconds=best_seconds, peak_bytes=peak_bytes)
+
+
+def measure(name: str, items: int, func: Callable[[], Any], *, repeat: int = 3) -> BenchmarkResult:
+    best: BenchmarkResult | None = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        seconds = time.perf_counter() - start
+        if best is None or seconds < best.seconds:
+            best = BenchmarkResult(name=name, items=items, seconds=seconds, peak_bytes=0)
+
+    assert best is not None  # noqa: S101
+    return best
+
+
+def print_results(title: str, results: Sequence[BenchmarkResult]) -> None:
+    print(f"\n{title}")  # noqa: T201
+    print(f"{'case':<40} {'items/s':>14} {'seconds':>10} {'peak MiB':>10}")  # noqa: T201
+    for result in results:
+        print(  # noqa: T201
+            f"{result.name:<40} {result.items_per_second:>14,.0f} "
+            f"{result.seconds:>10.4f} {result.peak_bytes / 1024 / 1024:>10.2f}"
+        )
@@ -0,0 +1,84 @@
+"""
+Compare `BaseCreateService.create` in a loop with `BaseCreateService.create_many`.
+
+Usage (from `app/`, against a disposable database):
+    python -m scripts.benchmarks.create_many
+"""
+
+from __future__ import annotations
+
+import asyncio
+
+from core.database import dispose_engine, get_engine, get_session_factory
+from core.repositories import BaseCreateRepository
+from core.services.base_create import BaseCreateService
+from pydantic import BaseModel
+from scripts.benchmarks._utils import (
+    BenchmarkRecord,
+    create_benchmark_table,
+    drop_benchmark_table,
+    make_records,
+    measure_async,
+    print_results,
+)
+
+ROW_COUNT = 5_000
+
+
+class BenchmarkRecordCreate(BaseModel):
+    name: str
+    status: str
+    score: int
+
+
+class BenchmarkCreateRepository(BaseCreateRepository):
+    pass
+
+
+class BenchmarkCreateService(BaseCreateService[BenchmarkRecordCreate]):
+    pass
+
+
+async def main() -> None:
+    engine = get_engine()
+    await create_benchmark_table(engine)
+    schemas = [BenchmarkRecordCreate(**record) for record in make_records(ROW_COUNT)]
+
+    def get_service(session: object) -> BenchmarkCreateService:
+        return BenchmarkCreateService(
+            session=session,  # type: ignore[arg-type]
+            model=BenchmarkRecord,
+            repository=BenchmarkCreateRepository,
+        )
+
+    async def create_in_loop() -> None:
+        async with get_session_factory()() as session:
+            service = get_service(session)
+            for schema in schemas:
+                await service.create(schema)
+            await session.rollback()
+
+    async def create_many_objects() -> None:
+        async with get_session_factory()() as session:
+            await get_service(session).create_many(schemas)
+            await session.rollback()
+
+    async def create_many_ids() -> None:
+        async with get_session_factory()() as session:
+            await get_service(session).create_many(schemas, return_objects=False)
+            await session.rollback()
+
+    try:
+        results = [
+            await measure_async("create (loop)", ROW_COUNT, create_in_loop),
+            await measure_async("create_many (objects)", ROW_COUNT, create_many_objects),
+            await measure_async("create_many (ids)", ROW_COUNT, create_many_ids),
+        ]
+        print_results(f"Creating {ROW_COUNT:,} rows", results)
+    finally:
+        await drop_benchmark_table(engine)
+        await dispose_engine()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,101 @@
+"""
+Compare the previous error-response path (full traceback extraction, nested pydantic
+models, `jsonable_encoder`) with the current handlers.
+
+Usage (from `app/`):
+    python -m scripts.benchmarks.error_responses
+"""
+
+from __future__ import annotations
+
+import asyncio
+import sys
+import traceback
+from datetime import datetime, timezone
+from typing import TYPE_CHECKING
+
+from core.exceptions import app_exceptions
+from core.exceptions.handlers import app_exception_handler
+from core.exceptions.response_schemas import (
+    AppExceptionResponse,
+    ExceptionResponse,
+    ExceptionSource,
+)
+from fastapi.encoders import jsonable_encoder
+from scripts.benchmarks._utils import measure, print_results
+from starlette.requests import Request
+from starlette.responses import JSONResponse, Response
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
+    from core.exceptions.app import AppExceptionCase
+
+RESPONSE_COUNT = 20_000
+
+
+def make_request() -> Request:
+    return Request(
+        {
+            "type": "http",
+            "method": "GET",
+            "path": "/items/42",
+            "query_string": b"",
+            "headers": [],
+            "server": ("testserver", 80),
+            "scheme": "http",
+            "root_path": "",
+        }
+    )
+
+
+async def legacy_app_exception_handler(request: Request, exc: AppExceptionCase) -> Response:
+    _, _, exc_traceback = sys.exc_info()
+    filename, line_number, function, _ = traceback.extract_tb(exc_traceback)[-1]
+    source = ExceptionSource(
+        file=filename,
+        line_number=line_number,
+        function_name=function,
+        api_path=request.url.path,
+        api_method=request.method,
+    )
+    content = AppExceptionResponse(
+        errors=[ExceptionResponse(**exc.__dict__, source=source)],
+        meta={"timestamp": str(datetime.now(timezone.utc))},
+    )
+    return JSONResponse(status_code=exc.status, content=jsonable_encoder(content))
+
+
+def raise_not_found() -> None:
+    raise app_exceptions.NotFoundError(model="Item", message="Item 42 was not found.")
+
+
+async def handle_errors(
+    handler: Callable[[Request, AppExceptionCase], Awaitable[Response]],
+) -> None:
+    request = make_request()
+    for _ in range(RESPONSE_COUNT):
+        try:
+            raise_not_found()
+        except app_exceptions.NotFoundError as exc:  # noqa: PERF203
+            await handler(request, exc)
+
+
+def main() -> None:
+    results = [
+        measure(
+            "legacy handler",
+            RESPONSE_COUNT,
+            lambda: asyncio.run(handle_errors(legacy_app_exception_handler)),
+        ),
+        measure(
+            "current handler",
+            RESPONSE_COUNT,
+            lambda: asyncio.run(handle_errors(app_exception_handler)),
+        ),
+    ]
+    print_results(f"Building {RESPONSE_COUNT:,} 404 error responses", results)
+
+
+if __name__ == "__main__":
+    main()
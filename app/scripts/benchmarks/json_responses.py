@@ -0,0 +1,60 @@
+"""
+Compare rendering large list payloads with `JSONResponse(jsonable_encoder(...))`, the
+orjson response class, and the pydantic-core path for validated models.
+
+Usage (from `app/`):
+    python -m scripts.benchmarks.json_responses
+"""
+
+from __future__ import annotations
+
+import uuid
+from datetime import datetime  # noqa: TC003
+
+from core.responses import ORJSONResponse
+from fastapi.encoders import jsonable_encoder
+from pydantic import BaseModel
+from scripts.benchmarks._utils import make_records, measure, print_results
+from starlette.responses import JSONResponse
+
+ITEM_COUNT = 50_000
+
+
+class BenchmarkItem(BaseModel):
+    id: int
+    uid: uuid.UUID
+    name: str
+    status: str
+    score: int
+    created_at: datetime
+
+
+def make_items() -> list[BenchmarkItem]:
+    return [
+        BenchmarkItem(id=index, uid=uuid.uuid4(), **record)
+        for index, record in enumerate(make_records(ITEM_COUNT))
+    ]
+
+
+def main() -> None:
+    items = make_items()
+    rows = [item.model_dump() for item in items]
+    results = [
+        measure(
+            "JSONResponse + jsonable_encoder",
+            ITEM_COUNT,
+            lambda: JSONResponse(jsonable_encoder(items)),
+        ),
+        measure(
+            "ORJSONResponse + jsonable_encoder",
+            ITEM_COUNT,
+            lambda: ORJSONResponse(jsonable_encoder(items)),
+        ),
+        measure("ORJSONResponse (dicts)", ITEM_COUNT, lambda: ORJSONResponse(rows)),
+        measure("ORJSONResponse (models)", ITEM_COUNT, lambda: ORJSONResponse(items)),
+    ]
+    print_results(f"Rendering {ITEM_COUNT:,} items", results)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""
+Compare the colored text formatter with the JSON formatter, with and without caller info.
+
+Usage (from `app/`):
+    python -m scripts.benchmarks.log_formatters
+"""
+
+from __future__ import annotations
+
+import io
+import logging
+from typing import TYPE_CHECKING
+
+from config.log_formatters import (
+    JsonFormatter,
+    LogContextFilter,
+    bind_log_context,
+    reset_log_context,
+)
+from config.logging import LoggerConfig
+from scripts.benchmarks._utils import measure, print_results
+from uvicorn.logging import DefaultFormatter
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+RECORD_COUNT = 50_000
+
+
+def build_logger(formatter: logging.Formatter, level: int = logging.DEBUG) -> logging.Logger:
+    logger = logging.getLogger("benchmark.log_formatters")
+    logger.handlers.clear()
+    logger.filters.clear()
+    logger.propagate = False
+    logger.setLevel(level)
+    handler = logging.StreamHandler(io.StringIO())
+    handler.setFormatter(formatter)
+    logger.addHandler(handler)
+    logger.addFilter(LogContextFilter())
+    return logger
+
+
+def log_records(logger: logging.Logger, method: Callable[..., None] | None = None) -> None:
+    emit = method or logger.info
+    for index in range(RECORD_COUNT):
+        emit("Processed order %s for %s", index, "customer", extra={"order_id": index})
+
+
+def main() -> None:
+    text_formatter = DefaultFormatter(
+        fmt=LoggerConfig.model_fields["LOG_FORMAT"].default,
+        datefmt="%Y-%m-%d %H:%M:%S",
+        use_colors=True,
+    )
+    token = bind_log_context(request_id="0" * 32, method="GET", path="/orders")
+    try:
+        text_logger = build_logger(text_formatter)
+        results = [
+            measure("text, colored, caller", RECORD_COUNT, lambda: log_records(text_logger))
+        ]
+
+        json_logger = build_logger(JsonFormatter(caller_info=True))
+        results.append(measure("json, caller", RECORD_COUNT, lambda: log_records(json_logger)))
+
+        json_logger = build_logger(JsonFormatter())
+        results.append(measure("json, no caller", RECORD_COUNT, lambda: log_records(json_logger)))
+
+        quiet_logger = build_logger(JsonFormatter(), level=logging.INFO)
+        results.append(
+            measure(
+                "debug below level",
+                RECORD_COUNT,
+                lambda: log_records(quiet_logger, quiet_logger.debug),
+            )
+        )
+    finally:
+        reset_log_context(token)
+
+    print_results(f"Formatting {RECORD_COUNT:,} log records", results)
+
+
+if __name__ == "__main__":
+    main()
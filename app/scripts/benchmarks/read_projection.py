@@ -0,0 +1,67 @@
+"""
+Compare full-entity reads with column-projection reads.
+
+Usage (from `app/`, against a disposable database):
+    python -m scripts.benchmarks.read_projection
+"""
+
+from __future__ import annotations
+
+import asyncio
+
+from core.database import dispose_engine, get_engine, get_session_factory
+from core.repositories import BaseReadRepository
+from scripts.benchmarks._utils import (
+    BenchmarkRecord,
+    create_benchmark_table,
+    drop_benchmark_table,
+    make_records,
+    measure_async,
+    print_results,
+)
+from sqlalchemy import insert
+
+ROW_COUNT = 100_000
+
+
+class BenchmarkReadRepository(BaseReadRepository):
+    pass
+
+
+async def main() -> None:
+    engine = get_engine()
+    await create_benchmark_table(engine)
+    try:
+        async with engine.begin() as conn:
+            await conn.execute(insert(BenchmarkRecord), make_records(ROW_COUNT))
+
+        async def read_entities() -> None:
+            async with get_session_factory()() as session:
+                repository = BenchmarkReadRepository(session=session, model=BenchmarkRecord)
+                await repository.get_all()
+
+        async def read_columns() -> None:
+            async with get_session_factory()() as session:
+                repository = BenchmarkReadRepository(session=session, model=BenchmarkRecord)
+                await repository.get_columns_by_params(["id", "name", "status"])
+
+        async def read_column_mappings() -> None:
+            async with get_session_factory()() as session:
+                repository = BenchmarkReadRepository(session=session, model=BenchmarkRecord)
+                await repository.get_columns_by_params(["id", "name", "status"], as_mappings=True)
+
+        results = [
+            await measure_async("get_all (scalars().all())", ROW_COUNT, read_entities),
+            await measure_async("get_columns_by_params (rows)", ROW_COUNT, read_columns),
+            await measure_async(
+                "get_columns_by_params (mappings)", ROW_COUNT, read_column_mappings
+            ),
+        ]
+        print_results(f"Reading {ROW_COUNT:,} rows", results)
+    finally:
+        await drop_benchmark_table(engine)
+        await dispose_engine()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
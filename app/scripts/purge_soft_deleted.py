@@ -0,0 +1,138 @@
+"""
+Hard-delete soft-deleted rows older than `SOFT_DELETE_RETENTION_DAYS`.
+
+The purge runs once a day inside the off-peak UTC window
+`SOFT_DELETE_PURGE_START_HOUR`..`SOFT_DELETE_PURGE_END_HOUR`, deleting
+`SOFT_DELETE_PURGE_CHUNK_SIZE` rows per short transaction with a pause between chunks,
+and stops between chunks once the window closes. Every mapped model using
+`SoftDeleteMixin` is purged; the app is imported first so that all its models are mapped.
+
+Usage (from `app/`):
+    python -m scripts.purge_soft_deleted          # wait for the window, purge, repeat
+    python -m scripts.purge_soft_deleted --now    # purge once and exit
+"""
+
+from __future__ import annotations
+
+import asyncio
+import importlib
+import sys
+from datetime import datetime, timedelta, timezone
+from typing import TYPE_CHECKING
+
+from config import app_config, logger
+from core.database import dispose_engine, get_session_factory
+from core.repositories import BaseDBModel, BaseDeleteRepository, SoftDeleteMixin
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+
+def get_soft_delete_models() -> list[type[BaseDBModel]]:
+    """Mapped models using `SoftDeleteMixin`, in table name order."""
+    models = [
+        mapper.class_
+        for mapper in BaseDBModel.registry.mappers
+        if issubclass(mapper.class_, SoftDeleteMixin) and issubclass(mapper.class_, BaseDBModel)
+    ]
+    return sorted(models, key=lambda model: model.__table__.name)
+
+
+async def purge_soft_deleted(
+    models: Sequence[type[BaseDBModel]] | None = None,
+    *,
+    retention: timedelta | None = None,
+    chunk_size: int | None = None,
+    pause_seconds: float | None = None,
+    within_window: bool = False,
+) -> dict[str, int]:
+    """
+    Hard-delete rows soft-deleted before `now - retention`; return counts per table.
+
+    `models` defaults to every model using `SoftDeleteMixin`. With `within_window`, the
+    purge stops between chunks once the off-peak window has closed.
+    """
+    models = get_soft_delete_models() if models is None else models
+    retention = retention or timedelta(days=app_config.SOFT_DELETE_RETENTION_DAYS)
+    cutoff = datetime.now(timezone.utc) - retention
+    should_stop = is_window_closed if within_window else None
+    purged: dict[str, int] = {}
+    for model in models:
+        if should_stop is not None and should_stop():
+            logger.info("Purge window closed, skipped soft-deleted rows of %s", model.__name__)
+            continue
+
+        async with get_session_factory()() as session:
+            repository = BaseDeleteRepository(session=session, model=model)
+            purged[model.__table__.name] = await repository.delete_by_params(
+                (model.deleted_at < cutoff,),
+                chunk_size=chunk_size or app_config.SOFT_DELETE_PURGE_CHUNK_SIZE,
+                pause_seconds=(
+                    app_config.SOFT_DELETE_PURGE_PAUSE_SECONDS
+                    if pause_seconds is None
+                    else pause_seconds
+                ),
+                commit=True,
+                hard=True,
+                should_stop=should_stop,
+            )
+        logger.info(
+            "Purged %s soft-deleted rows from %s older than %s",
+            purged[model.__table__.name],
+            model.__table__.name,
+            cutoff.isoformat(),
+        )
+    return purged
+
+
+def seconds_until_window(now: datetime | None = None) -> float:
+    """Seconds until the purge window opens, 0 when `now` is inside it."""
+    now = now or datetime.now(timezone.utc)
+    start = app_config.SOFT_DELETE_PURGE_START_HOUR
+    end = app_config.SOFT_DELETE_PURGE_END_HOUR
+    in_window = start <= now.hour < end if start <= end else now.hour >= start or now.hour < end
+    if in_window:
+        return 0.0
+
+    next_start = now.replace(hour=start, minute=0, second=0, microsecond=0)
+    if next_start <= now:
+        next_start += timedelta(days=1)
+    return (next_start - now).total_seconds()
+
+
+def is_window_closed() -> bool:
+    return seconds_until_window() > 0
+
+
+async def run_purge_scheduler(models: Sequence[type[BaseDBModel]] | None = None) -> None:
+    """Purge once per day inside the off-peak window; runs until cancelled."""
+    while True:
+        await asyncio.sleep(seconds_until_window())
+        try:
+            await purge_soft_deleted(models, within_window=True)
+        except Exception:  # noqa: BLE001
+            logger.exception("Soft-delete purge failed")
+        # Skip past the rest of today's window before waiting for the next one.
+        await asyncio.sleep(
+            (app_config.SOFT_DELETE_PURGE_END_HOUR - app_config.SOFT_DELETE_PURGE_START_HOUR)
+            % 24
+            * 3600
+        )
+
+
+async def main() -> None:
+    # Importing the app maps every model its routers use.
+    importlib.import_module("main")
+    models = get_soft_delete_models()
+    logger.info("Purging soft-deleted rows of %s", [model.__name__ for model in models])
+    try:
+        if "--now" in sys.argv:
+            await purge_soft_deleted(models)
+        else:
+            await run_purge_scheduler(models)
+    finally:
+        await dispose_engine()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+from datetime import datetime
+from typing import TYPE_CHECKING, Any, ClassVar
+
+import pytest
+from core.database import dispose_engine, get_engine, get_session_factory
+from core.repositories import SoftDeleteMixin
+from sqlalchemy import DateTime, String
+from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+
+    from sqlalchemy.ext.asyncio import AsyncSession
+
+
+class ModelBase(DeclarativeBase):
+    type_annotation_map: ClassVar[dict[Any, Any]] = {datetime: DateTime(timezone=True)}
+
+
+class _ItemColumns:
+    id: Mapped[int] = mapped_column(primary_key=True)
+    name: Mapped[str] = mapped_column(String(64))
+    created_at: Mapped[datetime | None]
+    updated_at: Mapped[datetime | None]
+    deleted_at: Mapped[datetime | None]
+    created_by_id: Mapped[int | None]
+    updated_by_id: Mapped[int | None]
+    deleted_by_id: Mapped[int | None]
+
+
+class Item(_ItemColumns, ModelBase):
+    __tablename__ = "test_item"
+
+
+class SoftDeletedItem(SoftDeleteMixin, _ItemColumns, ModelBase):
+    __tablename__ = "test_soft_deleted_item"
+
+
+@pytest.fixture
+async def session() -> AsyncIterator[AsyncSession]:
+    """A session on the configured database, with the test tables created for the test."""
+    async with get_engine().begin() as conn:
+        await conn.run_sync(ModelBase.metadata.drop_all)
+        await conn.run_sync(ModelBase.metadata.create_all)
+
+    try:
+        async with get_session_factory()() as session:
+            yield session
+    finally:
+        async with get_engine().begin() as conn:
+            await conn.run_sync(ModelBase.metadata.drop_all)
+        await dispose_engine()
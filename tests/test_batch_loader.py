@@ -0,0 +1,37 @@
+from __future__ import annotations
+
+import asyncio
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+from core.repositories.loader import BatchLoader
+
+
+class BlockingRepository:
+    def __init__(self) -> None:
+        self.calls: list[list[int]] = []
+        self.release = asyncio.Event()
+
+    async def get_many_by_ids(self, model_ids: list[int]) -> list[Any]:
+        self.calls.append(model_ids)
+        await self.release.wait()
+        return [SimpleNamespace(id=model_id) for model_id in model_ids]
+
+
+async def test_cancelling_one_load_does_not_cancel_other_waiters() -> None:
+    repository = BlockingRepository()
+    loader = BatchLoader(repository, asyncio.Lock())  # type: ignore[arg-type]
+
+    cancelled = asyncio.create_task(loader.load(1))
+    waiting = asyncio.create_task(loader.load(1))
+    await asyncio.sleep(0.01)
+    cancelled.cancel()
+    repository.release.set()
+
+    assert (await waiting).id == 1
+    with pytest.raises(asyncio.CancelledError):
+        await cancelled
+    assert repository.calls == [[1]]
+    assert (await loader.load(1)).id == 1
+    assert repository.calls == [[1]]
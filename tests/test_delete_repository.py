@@ -0,0 +1,41 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from core.repositories import BaseDeleteRepository
+from sqlalchemy import inspect, select
+from tests.conftest import Item, SoftDeletedItem
+
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncSession
+
+
+async def load_new(
+    session: AsyncSession, model: type[Item | SoftDeletedItem]
+) -> Item | SoftDeletedItem:
+    session.add(model(name="item"))
+    await session.commit()
+    session.expunge_all()
+    return (await session.execute(select(model))).scalar_one()
+
+
+async def test_delete_by_id_syncs_loaded_instance(session: AsyncSession) -> None:
+    item = await load_new(session, Item)
+
+    await BaseDeleteRepository(session, Item).delete_by_id(item.id)
+
+    assert inspect(item).was_deleted
+    assert item not in session
+    item.name = "renamed"
+    await session.commit()
+    assert (await session.execute(select(Item.id))).first() is None
+
+
+async def test_soft_delete_by_id_syncs_loaded_instance(session: AsyncSession) -> None:
+    item = await load_new(session, SoftDeletedItem)
+
+    await BaseDeleteRepository(session, SoftDeletedItem).delete_by_id(item.id, deleted_by_id=7)
+
+    assert item.deleted_at is not None
+    assert item.deleted_by_id == 7
+    assert item in session
@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+from typing import Any
+
+from core.cache.entity import EntityCache
+from core.cache.local import MISSING
+
+
+class FakeRedis:
+    def __init__(self) -> None:
+        self.values: dict[str, Any] = {}
+        self.pipelines = 0
+
+    async def get(self, key: str) -> Any:  # noqa: ANN401
+        return self.values.get(key)
+
+    async def set(self, key: str, value: Any, **_: Any) -> bool:  # noqa: ANN401
+        self.values[key] = value
+        return True
+
+    async def delete(self, *keys: str) -> None:
+        for key in keys:
+            self.values.pop(key, None)
+
+    def pipeline(self, **_: Any) -> Any:  # noqa: ANN401
+        self.pipelines += 1
+        raise NotImplementedError
+
+
+async def test_unserializable_payload_is_returned_but_not_cached() -> None:
+    redis = FakeRedis()
+    cache = EntityCache(
+        redis,  # type: ignore[arg-type]
+        prefix="test",
+        local_maxsize=10,
+        local_ttl=5.0,
+        lock_timeout_ms=100,
+    )
+    payload = {"id": 1, "data": b"\x00"}
+
+    async def load() -> dict[str, Any]:
+        return payload
+
+    key = cache.id_key("item", 1)
+    value = await cache.get_or_load(key, table="item", kind="ids", ttl=60, load=load)
+
+    assert value is payload
+    assert cache._local.get(key) is MISSING
+    assert redis.pipelines == 0
+    assert key not in redis.values
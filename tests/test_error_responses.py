@@ -0,0 +1,31 @@
+from __future__ import annotations
+
+import json
+
+import pytest
+from core.exceptions.handlers import _build_json_response
+
+
+class Unserializable:
+    def __str__(self) -> str:
+        return "unserializable"
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [
+        (Unserializable(), "unserializable"),
+        (frozenset({1}), [1]),
+        (2**70, 2**70),
+    ],
+)
+def test_error_response_renders_any_context_value(value: object, expected: object) -> None:
+    response = _build_json_response(
+        500, "Internal Server Error", "Unexpected error", context={"value": value}
+    )
+
+    # The stdlib parser, unlike orjson, accepts integers beyond 64 bits.
+    body = json.loads(response.body)
+    assert response.status_code == 500
+    assert body["errors"][0]["context"]["value"] == expected
+    assert body["meta"]["timestamp"]